@@ -12,6 +12,19 @@ import re
 
 FILE = "src/matlab_lsp_server/handlers/diagnostics.py"
 
+# Pattern 1: server.publish_diagnostics(file_uri, lsp_diagnostics)
+PUBLISH_PATTERN = rb'server\.publish_diagnostics\([^)]+\)'
+PUBLISH_REPLACEMENT = b'params = PublishDiagnosticsParams(uri=file_uri, diagnostics=lsp_diagnostics)\n            server.text_document_publish_diagnostics(params)'
+
+# Import section where PublishDiagnosticsParams is added
+IMPORT_PATTERN = rb'from lsprotocol\.types import \([^)]+\)'
+IMPORT_ADDITION = b'\nfrom lsprotocol.types import PublishDiagnosticsParams'
+
+# Both patterns combined so the file is scanned once
+FIX_PATTERN = re.compile(
+    b"(?P<imports>" + IMPORT_PATTERN + b")|(?P<publish>" + PUBLISH_PATTERN + b")"
+)
+
 def fix_diagnostics():
     """Fix diagnostics.py to use correct PyPI API."""
 
@@ -19,34 +32,44 @@ def fix_diagnostics():
         print(f"[ERROR] File not found: {FILE}")
         return False
 
-    with open(FILE, 'r', encoding='utf-8') as f:
+    # Work on raw bytes: the patterns are ASCII, so no decode/encode is needed
+    with open(FILE, 'rb') as f:
         content = f.read()
 
+    # Insert text with the file's own line endings (CRLF on Windows checkouts)
+    newline = b'\r\n' if b'\r\n' in content else b'\n'
+    publish_replacement = PUBLISH_REPLACEMENT.replace(b'\n', newline)
+    import_addition = IMPORT_ADDITION.replace(b'\n', newline)
+
     # Fix: Replace incorrect API call with correct API
     # Line 96 (approx): server.publish_diagnostics(...) -> server.text_document_publish_diagnostics(...)
+    # Need to import PublishDiagnosticsParams if not already present
+    needs_import = b'from lsprotocol.types import PublishDiagnosticsParams' not in content
+    import_added = False
 
-    # Pattern 1: server.publish_diagnostics(file_uri, lsp_diagnostics)
-    pattern1 = r'server\.publish_diagnostics\([^)]+\)'
-    replacement1 = r'params = PublishDiagnosticsParams(uri=file_uri, diagnostics=lsp_diagnostics)\n            server.text_document_publish_diagnostics(params)'
+    def dispatch(match):
+        nonlocal import_added
+        if match.lastgroup == "publish":
+            return publish_replacement
+        # Add import after the first lsprotocol.types import block
+        if needs_import and not import_added:
+            import_added = True
+            return match.group(0) + import_addition
+        return match.group(0)
 
-    # Need to import PublishDiagnosticsParams if not already present
-    # Check for import
-    if 'from lsprotocol.types import PublishDiagnosticsParams' not in content:
-        # Add import before def publish_diagnostics(...)
-        import_pattern = r'(from lsprotocol\.types import \([^)]+\))'
-        if re.search(import_pattern, content):
-            replacement_import = r'\1\nfrom lsprotocol.types import PublishDiagnosticsParams'
-            content = re.sub(import_pattern, replacement_import, content, count=1)
-            print("[INFO] Added import for PublishDiagnosticsParams")
-        else:
-            print("[WARNING] Could not find import section to add PublishDiagnosticsParams")
-
-    # Apply fix
-    new_content = re.sub(pattern1, replacement1, content)
-
-    # Write fixed content
-    with open(FILE, 'w', encoding='utf-8') as f:
+    # Apply fix and add import in a single pass over the file
+    new_content = FIX_PATTERN.sub(dispatch, content)
+
+    if import_added:
+        print("[INFO] Added import for PublishDiagnosticsParams")
+    elif needs_import:
+        print("[WARNING] Could not find import section to add PublishDiagnosticsParams")
+
+    # Write fixed content atomically
+    tmp_file = FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
         f.write(new_content)
+    os.replace(tmp_file, FILE)
 
     print(f"[SUCCESS] Fixed {FILE}")
     print("Changes:")
@@ -13,6 +13,34 @@ import re
 
 FILE = "src/matlab_lsp_server/protocol/document_sync.py"
 
+# Edit patterns, keyed by the group name used in FIX_PATTERN
+FIX_PATTERNS = {
+    # register_document_sync_handlers(document_store, mlint_analyzer)
+    # Need to add: symbol_table, matlab_parser
+    "signature": rb'def register_document_sync_handlers\(',
+    # did_open handler (around line 68): add parsing logic AFTER add_document
+    "did_open": rb'document_store\.add_document\(uri, file_path, content\)',
+    # did_close handler (around line 88): add symbol cleanup AFTER remove_document
+    "did_close": rb'document_store\.remove_document\(uri\)',
+    # document_sync.register_document_sync_handlers(server, document_store, mlint_analyzer)
+    "register_call": rb'document_sync\.register_document_sync_handlers\((?P<register_args>[^)]+)\)',
+}
+
+# Text appended after each match (register_call is rebuilt in dispatch)
+FIX_ADDITIONS = {
+    "signature": b'\n    document_store,\n    mlint_analyzer,\n    symbol_table: Optional[SymbolTable] = None,\n    matlab_parser: Optional[MatlabParser] = None',
+    "did_open": b'\n\n        # Added for v0.2.6: Parse MATLAB code to extract symbols\n        try:\n            parse_result = matlab_parser.parse_file(file_path, uri, use_cache=True)\n            symbol_table.update_from_parse_result(uri, content, parse_result)\n            logger.info(f"Updated symbol table for {file_path}")\n        except Exception as e:\n            logger.error(f"Error parsing file {file_path}: {e}")',
+    "did_close": b'\n\n        # Added for v0.2.6: Remove symbols from table\n        symbol_table.remove_symbols_by_uri(uri)',
+}
+
+# All edits combined into one alternation so the file is scanned once
+FIX_PATTERN = re.compile(
+    b"|".join(
+        b"(?P<" + name.encode() + b">" + pattern + b")"
+        for name, pattern in FIX_PATTERNS.items()
+    )
+)
+
 def fix_document_sync():
     """Fix document_sync.py to add MATLAB parsing."""
 
@@ -20,69 +48,65 @@ def fix_document_sync():
         print(f"[ERROR] File not found: {FILE}")
         return False
 
-    with open(FILE, 'r', encoding='utf-8') as f:
+    # Work on raw bytes: the patterns are ASCII, so no decode/encode is needed
+    with open(FILE, 'rb') as f:
         content = f.read()
 
+    # Insert text with the file's own line endings (CRLF on Windows checkouts)
+    newline = b'\r\n' if b'\r\n' in content else b'\n'
+    additions = {
+        name: text.replace(b'\n', newline)
+        for name, text in FIX_ADDITIONS.items()
+    }
+
     # Check if imports are already present
-    if 'from matlab_lsp_server.parser.matlab_parser import MatlabParser' in content:
+    if b'from matlab_lsp_server.parser.matlab_parser import MatlabParser' in content:
         print("[INFO] MatlabParser import already exists")
     else:
         # Add imports after line 20 (approximate)
         imports_to_add = [
-            '# Added for v0.2.6: MATLAB parsing\n',
-            'from matlab_lsp_server.parser.matlab_parser import MatlabParser\n',
-            'from matlab_lsp_server.parser.models import get_symbol_table\n',
+            b'# Added for v0.2.6: MATLAB parsing' + newline,
+            b'from matlab_lsp_server.parser.matlab_parser import MatlabParser' + newline,
+            b'from matlab_lsp_server.parser.models import get_symbol_table' + newline,
         ]
-        content = '\n'.join(imports_to_add) + content
+        content = newline.join(imports_to_add) + content
         print("[INFO] Added imports for MatlabParser and get_symbol_table")
 
-    # Check if function signature needs modification
-    # register_document_sync_handlers(document_store, mlint_analyzer)
-    # Need to add: symbol_table, matlab_parser
-    if 'def register_document_sync_handlers(' in content:
-        # Update function signature
-        content = re.sub(
-            r'def register_document_sync_handlers\(',
-            'def register_document_sync_handlers(\n    document_store,\n    mlint_analyzer,\n    symbol_table: Optional[SymbolTable] = None,\n    matlab_parser: Optional[MatlabParser] = None',
-            content
-        )
+    # Apply all edits in a single pass over the file
+    matched = set()
+
+    def dispatch(match):
+        name = match.lastgroup
+        matched.add(name)
+        if name == "register_call":
+            return (
+                b"document_sync.register_document_sync_handlers("
+                + match.group("register_args")
+                + b", symbol_table=None, matlab_parser=None)"
+            )
+        return match.group(0) + additions[name]
+
+    content = FIX_PATTERN.sub(dispatch, content)
+
+    if "signature" in matched:
         print("[INFO] Updated register_document_sync_handlers signature to include symbol_table and matlab_parser")
     else:
         print("[WARNING] Could not find register_document_sync_handlers function")
-
-    # Modify did_open handler (around line 68)
-    # Find: document_store.add_document(uri, file_path, content)
-    # Add parsing logic AFTER it
-    pattern = r"(document_store\.add_document\(uri, file_path, content\))"
-    replacement = r"document_store.add_document(uri, file_path, content)\n\n        # Added for v0.2.6: Parse MATLAB code to extract symbols\n        try:\n            parse_result = matlab_parser.parse_file(file_path, uri, use_cache=True)\n            symbol_table.update_from_parse_result(uri, content, parse_result)\n            logger.info(f\"Updated symbol table for {file_path}\")\n        except Exception as e:\n            logger.error(f\"Error parsing file {file_path}: {e}\")"
-    if re.search(pattern, content):
-        content = re.sub(pattern, replacement, content)
+    if "did_open" in matched:
         print("[INFO] Added MATLAB parsing logic to did_open handler")
     else:
         print("[WARNING] Could not find did_open handler pattern to add parsing logic")
-
-    # Modify did_close handler (around line 88)
-    # Find: document_store.remove_document(uri)
-    # Add symbol cleanup logic AFTER it
-    pattern = r"(document_store\.remove_document\(uri\))"
-    replacement = r"document_store.remove_document(uri)\n\n        # Added for v0.2.6: Remove symbols from table\n        symbol_table.remove_symbols_by_uri(uri)"
-    if re.search(pattern, content):
-        content = re.sub(pattern, replacement, content)
+    if "did_close" in matched:
         print("[INFO] Added symbol table cleanup logic to did_close handler")
     else:
         print("[WARNING] Could not find did_close handler pattern to add cleanup logic")
-
-    # Modify register_document_sync_handlers (around line 20)
-    # Find: document_sync.register_document_sync_handlers(server, document_store, mlint_analyzer)
-    # Add initialization logic
-    pattern = r"document_sync\.register_document_sync_handlers\(([^)]+)\)"
-    replacement = r"document_sync.register_document_sync_handlers(\1, symbol_table=None, matlab_parser=None)"
-    content = re.sub(pattern, replacement, content)
     print("[INFO] Initialized symbol_table and matlab_parser to None in register_document_sync_handlers call")
 
-    # Write fixed content
-    with open(FILE, 'w', encoding='utf-8') as f:
+    # Write fixed content atomically
+    tmp_file = FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
         f.write(content)
+    os.replace(tmp_file, FILE)
 
     print(f"[SUCCESS] Fixed {FILE}")
     print("Changes:")
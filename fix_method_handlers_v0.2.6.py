@@ -12,108 +12,110 @@ import re
 
 FILE = "src/matlab_lsp_server/protocol/method_handlers.py"
 
-def fix_method_handlers():
-    """Fix method_handlers.py to call correct methods."""
-
-    if not os.path.exists(FILE):
-        print(f"[ERROR] File not found: {FILE}")
-        return False
-
-    with open(FILE, 'r', encoding='utf-8') as f:
-        content = f.read()
-
+# Fix patterns, keyed by the group name used in FIX_PATTERN
+FIX_PATTERNS = {
     # Fix 1: Completion Handler (line 90)
     # Old: return await completion_handler.handle(params)
     # New: return completion_handler.provide_completion(server, uri, position, "")
-    content = re.sub(
-        r'return await completion_handler\.handle\(params\)',
-        'return completion_handler.provide_completion(\\n            server,\\n            params.text_document.uri,\\n            params.position,\\n            ""  # prefix\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Completion Handler")
-
+    "completion": rb'return await completion_handler\.handle\(params\)',
     # Fix 2: Hover Handler (line 96)
     # Old: return await hover_handler.handle(params)
     # New: return hover_handler.provide_hover(server, uri, position, None)
-    content = re.sub(
-        r'return await hover_handler\.handle\(params\)',
-        'return hover_handler.provide_hover(\\n            server,\\n            params.text_document.uri,\\n            params.position,\\n            None  # word\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Hover Handler")
-
+    "hover": rb'return await hover_handler\.handle\(params\)',
     # Fix 3: Definition Handler (line 102)
     # Old: return await definition_handler.handle(params)
     # New: return definition_handler.provide_definition(server, uri, position, None)
-    content = re.sub(
-        r'return await definition_handler\.handle\(params\)',
-        'return definition_handler.provide_definition(\\n            server,\\n            params.text_document.uri,\\n            params.position,\\n            None  # word\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Definition Handler")
-
+    "definition": rb'return await definition_handler\.handle\(params\)',
     # Fix 4: References Handler (line 108)
     # Old: return await references_handler.handle(params)
     # New: return references_handler.provide_references(server, uri, position, True)
-    content = re.sub(
-        r'return await references_handler\.handle\(params\)',
-        'return references_handler.provide_references(\\n            server,\\n            params.text_document.uri,\\n            params.position,\\n            True  # include_declaration\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed References Handler")
-
+    "references": rb'return await references_handler\.handle\(params\)',
     # Fix 5: Document Symbol Handler (line 114)
     # Old: return document_symbol_handler.provide_document_symbols(server, uri)
     # New: return document_symbol_handler.provide_document_symbols(server, uri, None)
-    content = re.sub(
-        r'return document_symbol_handler\.provide_document_symbols\(\\s*server,\\s*params\.text_document\.uri\\s*\)',
-        'return document_symbol_handler.provide_document_symbols(\\n            server,\\n            params.text_document.uri,\\n            None  # word\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Document Symbol Handler")
-
+    "document_symbol": rb'return document_symbol_handler\.provide_document_symbols\(\\s*server,\\s*params\.text_document\.uri\\s*\)',
     # Fix 6: Workspace Symbol Handler (line 161)
     # Old: return await workspace_symbol_handler.handle(params)
     # New: return workspace_symbol_handler.provide_workspace_symbols(server, None)
-    content = re.sub(
-        r'return await workspace_symbol_handler\.handle\(params\)',
-        'return workspace_symbol_handler.provide_workspace_symbols(\\n            server,\\n            None  # query\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Workspace Symbol Handler")
-
+    "workspace_symbol": rb'return await workspace_symbol_handler\.handle\(params\)',
     # Fix 7: Code Action Handler (line 128)
     # Old: return await code_action_handler.handle(params)
     # New: return code_action_handler.provide_code_actions(server, uri, [])
-    content = re.sub(
-        r'return await code_action_handler\.handle\(params\)',
-        'return code_action_handler.provide_code_actions(\\n            server,\\n            params.text_document.uri,\\n            []  # diagnostics\\n        )',
-        content,
-        count=1
-    )
-    print("[INFO] Fixed Code Action Handler")
-
+    "code_action": rb'return await code_action_handler\.handle\(params\)',
     # Fix 8: Formatting Handler (line 168)
     # Old: return await formatting_handler.handle(params)
     # New: return formatting_handler.provide_formatting(server, uri, content, None)
-    # Need to match the return line first
-    content = re.sub(
-        r'return await formatting_handler\.handle\(params\)',
-        'return formatting_handler.provide_formatting(\\n            server,\\n            params.text_document.uri,\\n            params.text_document.text,\\n            None  # options\\n        )',
-        content,
-        count=1
+    "formatting": rb'return await formatting_handler\.handle\(params\)',
+}
+
+FIX_REPLACEMENTS = {
+    "completion": b'return completion_handler.provide_completion(\n            server,\n            params.text_document.uri,\n            params.position,\n            ""  # prefix\n        )',
+    "hover": b'return hover_handler.provide_hover(\n            server,\n            params.text_document.uri,\n            params.position,\n            None  # word\n        )',
+    "definition": b'return definition_handler.provide_definition(\n            server,\n            params.text_document.uri,\n            params.position,\n            None  # word\n        )',
+    "references": b'return references_handler.provide_references(\n            server,\n            params.text_document.uri,\n            params.position,\n            True  # include_declaration\n        )',
+    "document_symbol": b'return document_symbol_handler.provide_document_symbols(\n            server,\n            params.text_document.uri,\n            None  # word\n        )',
+    "workspace_symbol": b'return workspace_symbol_handler.provide_workspace_symbols(\n            server,\n            None  # query\n        )',
+    "code_action": b'return code_action_handler.provide_code_actions(\n            server,\n            params.text_document.uri,\n            []  # diagnostics\n        )',
+    "formatting": b'return formatting_handler.provide_formatting(\n            server,\n            params.text_document.uri,\n            params.text_document.text,\n            None  # options\n        )',
+}
+
+FIX_LABELS = {
+    "completion": "Completion Handler",
+    "hover": "Hover Handler",
+    "definition": "Definition Handler",
+    "references": "References Handler",
+    "document_symbol": "Document Symbol Handler",
+    "workspace_symbol": "Workspace Symbol Handler",
+    "code_action": "Code Action Handler",
+    "formatting": "Formatting Handler",
+}
+
+# All fixes combined into one alternation so the file is scanned once
+FIX_PATTERN = re.compile(
+    b"|".join(
+        b"(?P<" + name.encode() + b">" + pattern + b")"
+        for name, pattern in FIX_PATTERNS.items()
     )
-    print("[INFO] Fixed Formatting Handler")
+)
+
+def fix_method_handlers():
+    """Fix method_handlers.py to call correct methods."""
+
+    if not os.path.exists(FILE):
+        print(f"[ERROR] File not found: {FILE}")
+        return False
+
+    # Work on raw bytes: the patterns are ASCII, so no decode/encode is needed
+    with open(FILE, 'rb') as f:
+        content = f.read()
 
-    # Write fixed content
-    with open(FILE, 'w', encoding='utf-8') as f:
+    # Insert text with the file's own line endings (CRLF on Windows checkouts)
+    newline = b'\r\n' if b'\r\n' in content else b'\n'
+    replacements = {
+        name: text.replace(b'\n', newline)
+        for name, text in FIX_REPLACEMENTS.items()
+    }
+
+    # Apply all fixes in a single pass over the file
+    applied = set()
+
+    def dispatch(match):
+        name = match.lastgroup
+        # Each fix replaces only its first occurrence
+        if name in applied:
+            return match.group(0)
+        applied.add(name)
+        return replacements[name]
+
+    content = FIX_PATTERN.sub(dispatch, content)
+    for label in FIX_LABELS.values():
+        print(f"[INFO] Fixed {label}")
+
+    # Write fixed content atomically
+    tmp_file = FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
         f.write(content)
+    os.replace(tmp_file, FILE)
 
     print(f"[SUCCESS] Fixed {FILE}")
     print("Changes:")
@@ -12,6 +12,30 @@ import sys
 
 FILE = "src/matlab_lsp_server/matlab_server.py"
 
+# Inserted after the last import line
+IMPORTS_TO_ADD = [
+    "# CRITICAL FIX v0.2.5: Import lifecycle handlers\n",
+    "from matlab_lsp_server.protocol.lifecycle import register_lifecycle_handlers\n",
+    "# CRITICAL FIX v0.2.5: Import method handlers\n",
+    "from matlab_lsp_server.protocol.method_handlers import register_method_handlers\n",
+]
+
+# Inserted before the "=== SERVER FULLY CONFIGURED ===" line
+CALLS_TO_ADD = [
+    "\n",
+    "            # CRITICAL FIX v0.2.5: Register shutdown/exit handlers (FIXES HANGING!)\n",
+    "            from matlab_lsp_server.protocol.lifecycle import register_lifecycle_handlers\n",
+    "            register_lifecycle_handlers(self)\n",
+    "            logger.info(\"Lifecycle handlers registered (shutdown/exit with return None)\")\n",
+    "\n",
+    "            # CRITICAL FIX v0.2.5: Register all LSP method handlers (FIXES DOCUMENT SYMBOLS!)\n",
+    "            from matlab_lsp_server.protocol.method_handlers import register_method_handlers\n",
+    "            register_method_handlers(self)\n",
+    "            logger.info(\"Method handlers registered (completion, hover, documentSymbol, etc.)\")\n",
+    "            logger.info(\"[INFO] All handlers now registered correctly!\")\n",
+    "\n",
+]
+
 def modify_matlab_server():
     """Modify matlab_server.py for v0.2.5."""
 
@@ -22,65 +46,48 @@ def modify_matlab_server():
     with open(FILE, 'r', encoding='utf-8') as f:
         lines = f.readlines()
 
-    modified = False
-    new_lines = []
-
-    # INSERT 1: Add imports after last import
+    # Find both insertion points in a single pass
     last_import_line = None
+    marker_line = None
     for i, line in enumerate(lines):
         if line.strip().startswith('from '):
             last_import_line = i
-        new_lines.append(line)
+        # "=== SERVER FULLY CONFIGURED ===" marks the end of _register_handlers
+        elif marker_line is None and "=== SERVER FULLY CONFIGURED ===" in line:
+            marker_line = i
 
-    if last_import_line is not None:
-        # Insert imports after last import line
-        imports_to_add = [
-            "# CRITICAL FIX v0.2.5: Import lifecycle handlers\n",
-            "from matlab_lsp_server.protocol.lifecycle import register_lifecycle_handlers\n",
-            "# CRITICAL FIX v0.2.5: Import method handlers\n",
-            "from matlab_lsp_server.protocol.method_handlers import register_method_handlers\n",
-        ]
-        for j, import_line in enumerate(imports_to_add):
-            new_lines.insert(last_import_line + 1 + j, import_line)
+    # (index, block) pairs; each block is inserted before lines[index]
+    insertions = []
 
+    # INSERT 1: Add imports after last import
+    if last_import_line is not None:
+        insertions.append((last_import_line + 1, IMPORTS_TO_ADD))
         print(f"[INFO] Added imports after line {last_import_line + 1}")
-        modified = True
     else:
         print("[WARNING] Could not find import section to insert after")
 
     # INSERT 2: Add registration calls at end of _register_handlers()
-    # Find line with "=== SERVER FULLY CONFIGURED ===" which is end of _register_handlers
-    for i, line in enumerate(new_lines):
-        if "=== SERVER FULLY CONFIGURED ===" in line:
-            # Insert registration calls BEFORE this line
-            calls_to_add = [
-                "\n",
-                "            # CRITICAL FIX v0.2.5: Register shutdown/exit handlers (FIXES HANGING!)\n",
-                "            from matlab_lsp_server.protocol.lifecycle import register_lifecycle_handlers\n",
-                "            register_lifecycle_handlers(self)\n",
-                "            logger.info(\"Lifecycle handlers registered (shutdown/exit with return None)\")\n",
-                "\n",
-                "            # CRITICAL FIX v0.2.5: Register all LSP method handlers (FIXES DOCUMENT SYMBOLS!)\n",
-                "            from matlab_lsp_server.protocol.method_handlers import register_method_handlers\n",
-                "            register_method_handlers(self)\n",
-                "            logger.info(\"Method handlers registered (completion, hover, documentSymbol, etc.)\")\n",
-                "            logger.info(\"[INFO] All handlers now registered correctly!\")\n",
-                "\n",
-            ]
-            for k, call_line in enumerate(calls_to_add):
-                new_lines.insert(i + k, call_line)
-
-            print(f"[INFO] Added registration calls before line {i}")
-            modified = True
-            break
-
-    if not modified:
+    if marker_line is not None:
+        # Insert registration calls BEFORE the marker line
+        insertions.append((marker_line, CALLS_TO_ADD))
+        print(f"[INFO] Added registration calls before line {marker_line}")
+
+    if not insertions:
         print("[WARNING] No modifications made to file")
         return False
 
+    # Splice the blocks in with slices instead of repeated list.insert()
+    new_lines = []
+    start = 0
+    for index, block in sorted(insertions, key=lambda item: item[0]):
+        new_lines.extend(lines[start:index])
+        new_lines.extend(block)
+        start = index
+    new_lines.extend(lines[start:])
+
     # Write modified file
     with open(FILE, 'w', encoding='utf-8') as f:
-        f.writelines(new_lines)
+        f.write("".join(new_lines))
 
     print(f"[SUCCESS] Modified {FILE} for v0.2.5")
     print("Changes:")
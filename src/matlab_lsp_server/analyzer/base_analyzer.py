@@ -4,33 +4,56 @@ Base Analyzer for MATLAB code analysis.
 This module provides abstract base class for all code analyzers.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from lsprotocol.types import Diagnostic, DiagnosticSeverity
 
 from matlab_lsp_server.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+@dataclass(slots=True)
+class AnalyzerDiagnostic:
+    """Single diagnostic message produced by an analyzer.
+
+    Attributes:
+        line (int): Line number (1-based)
+        column (int): Column number (1-based)
+        message (str): Diagnostic message
+        severity (DiagnosticSeverity): LSP severity (Error, Warning, ...)
+        code (str): Error code (if available)
+        source (str): Source of the diagnostic (e.g., "mlint")
+    """
+
+    line: int
+    column: int
+    message: str
+    severity: DiagnosticSeverity
+    code: str
+    source: str
+
+
 @dataclass
 class DiagnosticResult:
     """Result of code analysis containing diagnostics.
 
     Attributes:
         file_uri (str): URI of the analyzed file
-        diagnostics (List[Dict]): List of diagnostic messages
-            Each diagnostic is a dict with keys:
-            - line (int): Line number (1-based)
-            - column (int): Column number (1-based)
-            - message (str): Diagnostic message
-            - severity (str): "error" or "warning" or "info"
-            - code (str): Error code (if available)
-            - source (str): Source of the diagnostic (e.g., "mlint")
+        diagnostics (List[AnalyzerDiagnostic]): List of diagnostic messages
+        lsp_diagnostics (Optional[List[Diagnostic]]): LSP form of
+            diagnostics, filled on first conversion and reused while
+            the result is cached
     """
 
     file_uri: str
-    diagnostics: List[Dict[str, Any]]
+    diagnostics: List[AnalyzerDiagnostic]
+    lsp_diagnostics: Optional[List[Diagnostic]] = field(
+        default=None, repr=False, compare=False
+    )
 
 
 class BaseAnalyzer(ABC):
@@ -70,6 +93,50 @@ class BaseAnalyzer(ABC):
         """
         pass
 
+    def analyze_many(
+        self, files: List[Tuple[str, str]]
+    ) -> List[DiagnosticResult]:
+        """
+        Analyze several files.
+
+        The default implementation calls analyze() for each file;
+        analyzers that can process several files at once can override it.
+
+        Args:
+            files (List[Tuple[str, str]]): (file_uri, file_path) pairs
+
+        Returns:
+            List[DiagnosticResult]: One result per input, in input order
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+            Exception: If analysis fails
+        """
+        return [
+            self.analyze(file_uri, file_path) for file_uri, file_path in files
+        ]
+
+    async def analyze_async(
+        self, file_uri: str, file_path: str
+    ) -> DiagnosticResult:
+        """
+        Analyze a file without blocking the event loop.
+
+        The default implementation runs analyze() in the default
+        executor; analyzers backed by a subprocess can override it.
+
+        Args:
+            file_uri (str): URI of the file to analyze
+            file_path (str): Local path to the file to analyze
+
+        Returns:
+            DiagnosticResult: Analysis result with diagnostics
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.analyze, file_uri, file_path
+        )
+
     def is_available(self) -> bool:
         """
         Check if analyzer is available and ready to use.
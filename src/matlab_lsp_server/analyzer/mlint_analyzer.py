@@ -4,18 +4,338 @@ Mlint Analyzer for MATLAB code.
 This module provides integration with MATLAB's Code Analyzer (mlint.exe).
 """
 
+import asyncio
+import glob
+import hashlib
+import json
+import locale
 import os
 import platform
 import re
+import shutil
 import subprocess
+import sys
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from lsprotocol.types import DiagnosticSeverity
 
 from matlab_lsp_server.utils.logging import get_logger
-from .base_analyzer import BaseAnalyzer, DiagnosticResult
+from .base_analyzer import (
+    AnalyzerDiagnostic,
+    BaseAnalyzer,
+    DiagnosticResult,
+)
 
 logger = get_logger(__name__)
 
+# Encoding of mlint output (as used by subprocess text mode)
+_OUTPUT_ENCODING = locale.getpreferredencoding(False)
+
+
+def _decode(raw: bytes) -> str:
+    """Decode a fragment of mlint output."""
+    return raw.decode(_OUTPUT_ENCODING, errors="replace")
+
+
+def _subprocess_kwargs() -> Dict[str, Any]:
+    """Build platform-specific keyword arguments for spawning mlint.
+
+    On Windows mlint is started without a console window, which avoids
+    allocating a conhost for every analysis.
+
+    Returns:
+        Dict[str, Any]: Extra Popen/create_subprocess_exec arguments
+    """
+    # sys.platform (not platform.system()) so type checkers know the
+    # Windows-only names below exist
+    if sys.platform != "win32":
+        return {"close_fds": True}
+
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return {
+        "creationflags": subprocess.CREATE_NO_WINDOW,
+        "startupinfo": startupinfo,
+    }
+
+
+# Extra arguments for every mlint subprocess
+_SUBPROCESS_KWARGS = _subprocess_kwargs()
+
+# Locations of mlint relative to the configured MATLAB root
+MLINT_CONFIGURED_PATHS = (
+    ("bin", "win64", "mlint.exe"),
+    ("bin", "mlint.exe"),
+)
+
+# Names of the mlint executable searched for in PATH
+MLINT_NAMES = ("mlint.exe", "mlint")
+
+# Locations of mlint relative to a MATLAB root or install directory
+MLINT_DIR_PATTERNS = (
+    "bin/*/{name}",
+    "bin/{name}",
+    "*/bin/*/{name}",
+    "*/bin/{name}",
+)
+
+# Common MATLAB installation directories by platform.system()
+MLINT_COMMON_DIRS: Dict[str, Tuple[Path, ...]] = {
+    "Windows": (
+        Path("C:/Program Files/MATLAB"),
+        Path("C:/Program Files (x86)/MATLAB"),
+        Path("D:/Program Files/MATLAB"),
+        Path("E:/Program Files/MATLAB"),
+        Path("F:/Program Files/MATLAB"),
+        Path("G:/Program Files/MATLAB"),
+        Path("H:/Program Files/MATLAB"),
+        Path("I:/Program Files/MATLAB"),
+        Path("J:/Program Files/MATLAB"),
+    ),
+    "Darwin": (
+        Path("/Applications/MATLAB.app"),
+        Path("/usr/local/MATLAB"),
+    ),
+    "Linux": (
+        Path("/usr/local/MATLAB"),
+        Path("/opt/MATLAB"),
+        Path("/opt/matlab"),
+        Path("/usr/local/matlab"),
+        Path.home() / "MATLAB",
+        Path.home() / "matlab",
+        Path("/usr/share/matlab"),
+    ),
+}
+
+
+def _common_matlab_dirs(system: str) -> Iterator[Path]:
+    """
+    Yield existing common MATLAB installation directories, lazily.
+
+    Args:
+        system (str): Platform name as returned by platform.system()
+
+    Yields:
+        Path: Installation directory to search for mlint
+    """
+    if system == "Darwin":
+        # Try newest versioned install first
+        yield from sorted(
+            Path("/Applications").glob("MATLAB_R*.app"), reverse=True
+        )
+    for base in MLINT_COMMON_DIRS.get(system, MLINT_COMMON_DIRS["Linux"]):
+        if base.is_dir():
+            yield base
+
+
+def _discover_mlint_path(matlab_path: Optional[str]) -> Optional[str]:
+    """
+    Find mlint.exe executable by searching the filesystem.
+
+    Searches in multiple locations:
+    1. Configured MATLAB path (if provided and valid)
+    2. System PATH (direct lookup, then one level below)
+    3. Common MATLAB installation paths
+
+    Args:
+        matlab_path (Optional[str]): Configured MATLAB installation directory
+
+    Returns:
+        Optional[str]: Path to mlint.exe or None if not found
+    """
+    if matlab_path:
+        # Use configured MATLAB path if it exists
+        if os.path.isdir(matlab_path):
+            for parts in MLINT_CONFIGURED_PATHS:
+                path = os.path.join(matlab_path, *parts)
+                if os.path.isfile(path):
+                    logger.debug("Found mlint at configured path: %s", path)
+                    return path
+        else:
+            logger.warning(
+                "Configured MATLAB path does not exist: %s. "
+                "Searching for alternative...",
+                matlab_path,
+            )
+
+    # Search in PATH
+    mlint_in_path = _find_mlint_in_path()
+    if mlint_in_path:
+        logger.info("Found mlint in PATH: %s", mlint_in_path)
+        return mlint_in_path
+
+    # Search in common installation paths (platform-specific), stopping
+    # at the first directory that contains mlint
+    mlint_path = next(
+        filter(
+            None,
+            map(_find_mlint_in_dir, _common_matlab_dirs(platform.system())),
+        ),
+        None,
+    )
+    if mlint_path:
+        logger.info("Found mlint at: %s", mlint_path)
+        return mlint_path
+
+    logger.warning("mlint not found in any location")
+    return None
+
+
+def _find_mlint_in_path() -> Optional[str]:
+    """Search for mlint in PATH directories and one level below them.
+
+    PATH usually holds MATLAB/bin while mlint lives in bin/<arch>, so
+    besides the direct lookup only the immediate subdirectories of each
+    PATH entry are checked; nothing is walked recursively.
+
+    Returns:
+        Path to mlint executable or None
+    """
+    for mlint_name in MLINT_NAMES:
+        found = shutil.which(mlint_name)
+        if found:
+            return found
+
+    for path_dir in os.environ.get("PATH", "").split(os.pathsep):
+        if not path_dir:
+            continue
+        try:
+            with os.scandir(path_dir) as entries:
+                subdirs = [entry.path for entry in entries if entry.is_dir()]
+        except OSError:
+            continue
+
+        for subdir in subdirs:
+            for mlint_name in MLINT_NAMES:
+                full_path = os.path.join(subdir, mlint_name)
+                if os.path.isfile(full_path):
+                    return full_path
+
+    return None
+
+
+def _find_mlint_in_dir(base_dir: Path) -> Optional[str]:
+    """Find mlint in a MATLAB installation directory.
+
+    mlint lives in <version>/bin/<arch>/ (or directly in bin/), so only
+    those locations are checked instead of walking the whole tree.
+
+    Args:
+        base_dir: Base directory to search (e.g., "C:/Program Files/MATLAB")
+
+    Returns:
+        Path to mlint executable or None
+    """
+    # mlint binary name
+    mlint_name = "mlint.exe" if platform.system() == "Windows" else "mlint"
+
+    for pattern in MLINT_DIR_PATTERNS:
+        matches = glob.glob(
+            os.path.join(base_dir, pattern.format(name=mlint_name))
+        )
+        # Try newest version first
+        for path in sorted(matches, reverse=True):
+            if os.path.isfile(path):
+                return path
+
+    return None
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path for comparison with paths echoed by mlint."""
+    return os.path.normcase(os.path.abspath(path))
+
+
+# Persisted result of the last successful mlint discovery
+MLINT_CACHE_FILE = Path.home() / ".cache" / "matlab-lsp" / "mlint_path"
+
+
+def _load_cached_mlint_path(matlab_path: Optional[str]) -> Optional[str]:
+    """Load mlint path persisted by a previous process.
+
+    The entry is only used if it was written for the same configured
+    MATLAB path and the executable still exists with the same mtime.
+
+    Args:
+        matlab_path (Optional[str]): Configured MATLAB installation directory
+
+    Returns:
+        Optional[str]: Cached mlint path or None if missing or stale
+    """
+    try:
+        with open(MLINT_CACHE_FILE, "r", encoding="utf-8") as f:
+            entry = json.load(f)
+        path = entry["path"]
+        if (
+            entry.get("matlab_path") == matlab_path
+            and os.path.exists(path)
+            and os.path.getmtime(path) == entry["mtime"]
+        ):
+            return path
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _save_cached_mlint_path(matlab_path: Optional[str], path: str) -> None:
+    """Persist discovered mlint path for subsequent process starts.
+
+    Args:
+        matlab_path (Optional[str]): Configured MATLAB installation directory
+        path (str): Discovered mlint path
+    """
+    try:
+        MLINT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "matlab_path": matlab_path,
+            "path": path,
+            "mtime": os.path.getmtime(path),
+        }
+        tmp_file = MLINT_CACHE_FILE.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp_file, MLINT_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Could not persist mlint path: %s", e)
+
+
+# mlint paths found in this process by (MATLAB path, platform); failed
+# lookups are not stored, so installing MATLAB later is picked up
+_MLINT_PATH_CACHE: Dict[Tuple[Optional[str], str], str] = {}
+
+
+def _resolve_mlint_path(
+    matlab_path: Optional[str], system: str
+) -> Optional[str]:
+    """Resolve mlint path, using in-process and on-disk caches.
+
+    Args:
+        matlab_path (Optional[str]): Configured MATLAB installation directory
+        system (str): Platform name (part of the cache key)
+
+    Returns:
+        Optional[str]: Path to mlint.exe or None if not found
+    """
+    key = (matlab_path, system)
+    path = _MLINT_PATH_CACHE.get(key)
+    if path:
+        return path
+
+    path = _load_cached_mlint_path(matlab_path)
+    if path:
+        logger.debug("Using cached mlint path: %s", path)
+    else:
+        path = _discover_mlint_path(matlab_path)
+        if path:
+            _save_cached_mlint_path(matlab_path, path)
+
+    if path:
+        _MLINT_PATH_CACHE[key] = path
+    return path
+
 
 class MlintAnalyzer(BaseAnalyzer):
     """Analyzer for MATLAB code using mlint.exe.
@@ -24,14 +344,29 @@ class MlintAnalyzer(BaseAnalyzer):
     .m files and parse -> output into structured diagnostics.
     """
 
-    # Regex patterns to parse mlint output
-    # Pattern 1: "L line (ID): message" (with -id flag)
-    # Pattern 2: "L line: message" (simple format)
+    # Maximum number of cached analysis results
+    RESULT_CACHE_SIZE = 256
+
+    # Regex pattern to parse raw (undecoded) mlint output, matching both
+    # "L line (ID): message" (with -id flag) and
+    # "L line: message" (simple format) in a single pass
     # Note: The ID part can be like "C 5-10" or "FNDEF"
-    MLINT_PATTERN_WITH_ID = re.compile(
-        r"^L\s+(\d+)\s+\(([^)]+)\)\s*:\s*(.+)$", re.MULTILINE
+    MLINT_PATTERN = re.compile(rb"^L\s+(\d+)\s*(?:\(([^)]+)\))?\s*:\s*(.+)$")
+    # Pre-bound match (a builtin method, so it is not re-bound per instance)
+    _match_line = MLINT_PATTERN.match
+
+    # LSP severity by first character of the mlint message ID
+    _SEVERITY_BY_CHAR = {
+        "E": DiagnosticSeverity.Error,  # Error
+        "F": DiagnosticSeverity.Error,  # Fatal
+        "C": DiagnosticSeverity.Warning,  # Code Analyzer
+        "W": DiagnosticSeverity.Warning,  # Warning
+        "I": DiagnosticSeverity.Information,  # Info
+    }
+    # Lowercase IDs too, so lookups need no upper()
+    _SEVERITY_BY_CHAR.update(
+        {char.lower(): sev for char, sev in _SEVERITY_BY_CHAR.items()}
     )
-    MLINT_PATTERN_SIMPLE = re.compile(r"^L\s+(\d+)\s*:\s*(.+)$", re.MULTILINE)
 
     def __init__(self, matlab_path: Optional[str] = None):
         """Initialize MlintAnalyzer.
@@ -42,157 +377,101 @@ class MlintAnalyzer(BaseAnalyzer):
         """
         super().__init__(matlab_path=matlab_path)
         self.mlint_path = self._find_mlint_path()
+        # Discovery only returns existing paths, so no need to stat again
+        self._available = self.mlint_path is not None
+        # Bounds concurrent mlint processes started by analyze_async()
+        self._semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+        # LRU of results keyed by (file_uri, content digest)
+        self._result_cache: OrderedDict[
+            Tuple[str, bytes], DiagnosticResult
+        ] = OrderedDict()
+        # Content digest by file_uri, valid while (mtime_ns, size) match
+        self._digest_by_uri: OrderedDict[
+            str, Tuple[int, int, bytes]
+        ] = OrderedDict()
+        # Guards both caches: analyze_many() runs in executor threads
+        # while analyze_async() runs on the event loop
+        self._cache_lock = threading.Lock()
 
     def _find_mlint_path(self) -> Optional[str]:
         """
         Find mlint.exe executable.
 
-        Searches in multiple locations:
-        1. Configured MATLAB path (if provided and valid)
-        2. System PATH (recursive search)
-        3. Common MATLAB installation paths
+        Found paths are cached per configured MATLAB path, in process
+        and on disk, so the filesystem is only searched until mlint is
+        found.
 
         Returns:
             Optional[str]: Path to mlint.exe or None if not found
         """
-        if self.matlab_path:
-            # Use configured MATLAB path if it exists
-            matlab_dir = Path(self.matlab_path)
-            if matlab_dir.exists():
-                possible_paths = [
-                    matlab_dir / "bin" / "win64" / "mlint.exe",
-                    matlab_dir / "bin" / "mlint.exe",
-                ]
-                for path in possible_paths:
-                    if path.exists():
-                        logger.debug(f"Found mlint at configured path: {path}")
-                        return str(path)
-            else:
-                logger.warning(
-                    f"Configured MATLAB path does not exist: {self.matlab_path}. "
-                    "Searching for alternative..."
-                )
-
-        # Search in PATH (recursive)
-        mlint_in_path = self._find_mlint_in_path_recursive()
-        if mlint_in_path:
-            logger.info(f"Found mlint in PATH: {mlint_in_path}")
-            return mlint_in_path
-
-        # Search in common installation paths (platform-specific)
-        if platform.system() == "Windows":
-            common_paths = [
-                Path("C:/Program Files/MATLAB"),
-                Path("C:/Program Files (x86)/MATLAB"),
-                Path("D:/Program Files/MATLAB"),
-                Path("E:/Program Files/MATLAB"),
-                Path("F:/Program Files/MATLAB"),
-                Path("G:/Program Files/MATLAB"),
-                Path("H:/Program Files/MATLAB"),
-                Path("I:/Program Files/MATLAB"),
-                Path("J:/Program Files/MATLAB"),
-            ]
-        elif platform.system() == "Darwin":  # macOS
-            common_paths = [
-                Path("/Applications/MATLAB_R*.app"),
-                Path("/Applications/MATLAB.app"),
-                Path("/usr/local/MATLAB"),
-            ]
-        else:  # Linux and others
-            common_paths = [
-                Path("/usr/local/MATLAB"),
-                Path("/opt/MATLAB"),
-                Path("/opt/matlab"),
-                Path("/usr/local/matlab"),
-                Path.home() / "MATLAB",
-                Path.home() / "matlab",
-                Path("/usr/share/matlab"),
-            ]
-
-        for base in common_paths:
-            # Handle glob patterns for macOS versions
-            if "*" in str(base):
-                import glob as glob_module
-
-                matches = glob_module.glob(str(base))
-                for match in sorted(matches, reverse=True):
-                    # Try newest version first
-                    mlint_path = self._find_mlint_in_dir(Path(match))
-                    if mlint_path:
-                        logger.info(f"Found mlint at: {mlint_path}")
-                        return mlint_path
-            elif base.exists():
-                mlint_path = self._find_mlint_in_dir(base)
-                if mlint_path:
-                    logger.info(f"Found mlint at: {mlint_path}")
-                    return mlint_path
-
-        logger.warning("mlint not found in any location")
-        return None
-
-    def _find_mlint_in_path_recursive(self) -> Optional[str]:
-        """Recursively search for mlint.exe in PATH directories.
+        return _resolve_mlint_path(self.matlab_path, platform.system())
 
-        Returns:
-            Path to mlint.exe or None
-        """
-        mlint_names = ["mlint.exe"]
+    def is_available(self) -> bool:
+        """Check if mlint analyzer is available."""
+        return self._available
 
-        for path_dir in os.environ.get("PATH", "").split(os.pathsep):
-            base_dir = Path(path_dir)
-            if not base_dir.exists():
-                continue
+    def refresh_availability(self) -> bool:
+        """Re-check that the mlint executable still exists.
 
-            # Search recursively up to 3 levels deep
-            for root, dirs, files in os.walk(base_dir):
-                # Limit depth to avoid searching entire filesystem
-                depth = root.replace(str(base_dir), "").count(os.sep)
-                if depth > 3:
-                    dirs[:] = []  # Don't go deeper
-                    continue
+        If it was never found or has gone away, mlint is searched for
+        again, so a MATLAB installed or moved meanwhile is picked up.
 
-                for mlint_name in mlint_names:
-                    if mlint_name in files:
-                        full_path = Path(root) / mlint_name
-                        if full_path.exists():
-                            return str(full_path)
+        Returns:
+            bool: True if mlint is available, False otherwise
+        """
+        if self.mlint_path is None or not os.path.isfile(self.mlint_path):
+            _MLINT_PATH_CACHE.pop((self.matlab_path, platform.system()), None)
+            self.mlint_path = self._find_mlint_path()
+        self._available = self.mlint_path is not None and os.path.isfile(
+            self.mlint_path
+        )
+        return self._available
 
-        return None
+    def get_name(self) -> str:
+        """Get analyzer name."""
+        return "MlintAnalyzer"
 
-    def _find_mlint_in_dir(self, base_dir: Path) -> Optional[str]:
-        """Find mlint in a directory tree.
+    def analyze(self, file_uri: str, file_path: str) -> DiagnosticResult:
+        """
+        Analyze file using mlint.exe.
 
         Args:
-            base_dir: Base directory to search (e.g., "C:/Program Files/MATLAB")
+            file_uri (str): URI of file (e.g., "file:///path/to/file.m")
+            file_path (str): Local path to the file
 
         Returns:
-            Path to mlint executable or None
+            DiagnosticResult: Analysis result with diagnostics
+
+        Raises:
+            FileNotFoundError: If file does not exist
+            RuntimeError: If mlint is not available or analysis fails
         """
-        # mlint binary name
-        mlint_names = ["mlint.exe"] if platform.system() == "Windows" else ["mlint"]
+        self._check_can_analyze([file_path])
 
-        # Only search in bin directories (mlint is always in bin/)
-        for root, dirs, files in os.walk(base_dir):
-            if "bin" in root:
-                for mlint_name in mlint_names:
-                    if mlint_name in files:
-                        return str(Path(root) / mlint_name)
+        cache_key = self._cache_key(file_uri, file_path)
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
 
-        return None
+        logger.debug("Analyzing file: %s", file_path)
 
-    def is_available(self) -> bool:
-        """Check if mlint analyzer is available."""
-        if self.mlint_path is None:
-            return False
-        return os.path.exists(self.mlint_path)
+        lines = self._run_mlint([file_path])
+        diagnostics = [d for d in map(self._parse_line, lines) if d]
 
-    def get_name(self) -> str:
-        """Get analyzer name."""
-        return "MlintAnalyzer"
+        logger.debug("Found %d diagnostics", len(diagnostics))
+        result = DiagnosticResult(file_uri=file_uri, diagnostics=diagnostics)
+        self._cache_result(cache_key, result)
+        return result
 
-    def analyze(self, file_uri: str, file_path: str) -> DiagnosticResult:
+    async def analyze_async(
+        self, file_uri: str, file_path: str
+    ) -> DiagnosticResult:
         """
-        Analyze file using mlint.exe.
+        Analyze file using mlint.exe without blocking the event loop.
+
+        mlint runs via asyncio.create_subprocess_exec, so several files
+        can be analyzed concurrently (bounded by the CPU count) while the
+        server keeps answering requests.
 
         Args:
             file_uri (str): URI of file (e.g., "file:///path/to/file.m")
@@ -205,123 +484,303 @@ class MlintAnalyzer(BaseAnalyzer):
             FileNotFoundError: If file does not exist
             RuntimeError: If mlint is not available or analysis fails
         """
-        # Check file exists
-        if not os.path.exists(file_path):
-            logger.error(f"File not found: {file_path}")
-            raise FileNotFoundError(f"File not found: {file_path}")
+        mlint_path = self._check_can_analyze([file_path])
 
-        # Check mlint is available
-        if not self.is_available():
-            raise RuntimeError("mlint.exe is not available")
+        # Stat and hash the file off the event loop
+        cache_key = await asyncio.get_running_loop().run_in_executor(
+            None, self._cache_key, file_uri, file_path
+        )
+        cached = self._get_cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        logger.debug("Analyzing file asynchronously: %s", file_path)
+
+        diagnostics: List[AnalyzerDiagnostic] = []
+        # Bound once outside the per-line loop
+        append = diagnostics.append
+        parse_line = self._parse_line
+        async with self._semaphore:
+            proc = await asyncio.create_subprocess_exec(
+                mlint_path,
+                file_path,
+                "-id",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                **_SUBPROCESS_KWARGS,
+            )
+            assert proc.stdout is not None
+            try:
+                async for raw_line in proc.stdout:
+                    diagnostic = parse_line(raw_line)
+                    if diagnostic is not None:
+                        append(diagnostic)
+                await proc.wait()
+            except asyncio.CancelledError:
+                # Superseded analysis: don't leave mlint running
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.wait()
+                raise
+
+        logger.debug("Found %d diagnostics", len(diagnostics))
+        result = DiagnosticResult(file_uri=file_uri, diagnostics=diagnostics)
+        self._cache_result(cache_key, result)
+        return result
+
+    def analyze_many(
+        self, files: List[Tuple[str, str]]
+    ) -> List[DiagnosticResult]:
+        """
+        Analyze several files with a single mlint invocation.
 
-        # Assert mlint_path is not None (mypy doesn't narrow type from is_available)
-        assert (
-            self.mlint_path is not None
-        ), "mlint_path should be set if is_available() is True"
+        mlint has no persistent/batch mode, but accepts several files
+        and prefixes each file's messages with a
+        "========== path ==========" header, so process startup is paid
+        once per batch instead of once per file. Files with cached
+        results are not re-analyzed.
 
-        logger.debug(f"Analyzing file: {file_path}")
+        Args:
+            files (List[Tuple[str, str]]): (file_uri, file_path) pairs
 
-        # Run mlint
-        # mlint returns non-zero if issues are found - this is expected
-        # Don't use check=True to avoid CalledProcessError
-        result = subprocess.run(
-            [self.mlint_path, file_path, "-id"],
-            capture_output=True,
-            text=True,
-        )
-        # Mlint outputs diagnostics to stderr
-        output = result.stderr if result.stderr else result.stdout
+        Returns:
+            List[DiagnosticResult]: One result per input, in input order
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+            RuntimeError: If mlint is not available or analysis fails
+        """
+        self._check_can_analyze([file_path for _, file_path in files])
+
+        # Only run mlint for files whose content is not cached
+        keys = [self._cache_key(file_uri, path) for file_uri, path in files]
+        cached = [self._get_cached_result(key) for key in keys]
+        missing = [i for i, result in enumerate(cached) if result is None]
+        if len(missing) == 1:
+            # mlint prints no per-file header for a single file
+            cached[missing[0]] = self.analyze(*files[missing[0]])
+        elif missing:
+            logger.debug("Analyzing %d files in one batch", len(missing))
+            fresh = self._run_batch([files[i] for i in missing])
+            for i, result in zip(missing, fresh):
+                if result is None:
+                    # No header matched this file (e.g., a symlinked or
+                    # short path), so its messages can't be told apart;
+                    # analyze it alone rather than cache an empty result
+                    logger.debug(
+                        "No mlint output header for %s, analyzing separately",
+                        files[i][1],
+                    )
+                    result = self.analyze(*files[i])
+                else:
+                    self._cache_result(keys[i], result)
+                cached[i] = result
+
+        results = []
+        for (_, file_path), result in zip(files, cached):
+            if result is None:
+                raise RuntimeError(f"No analysis result for {file_path}")
+            results.append(result)
+        return results
+
+    def _run_batch(
+        self, files: List[Tuple[str, str]]
+    ) -> List[Optional[DiagnosticResult]]:
+        """
+        Run one mlint process for several files and split its output.
+
+        Args:
+            files (List[Tuple[str, str]]): (file_uri, file_path) pairs
+
+        Returns:
+            List[Optional[DiagnosticResult]]: One result per input, in
+                input order; None for files no output header matched
+        """
+        results: List[Optional[DiagnosticResult]] = [None] * len(files)
+        index_by_path = {
+            _normalize_path(file_path): i
+            for i, (_, file_path) in enumerate(files)
+        }
+        # Bound methods: rebinding append once per file header keeps
+        # attribute lookups out of the per-line loop
+        parse_line = self._parse_line
+        append: Optional[Callable[[AnalyzerDiagnostic], None]] = None
+        for line in self._run_mlint([file_path for _, file_path in files]):
+            if line.startswith(b"=========="):
+                header_path = _decode(line.strip().strip(b"=").strip())
+                i = index_by_path.get(_normalize_path(header_path))
+                if i is None:
+                    append = None
+                    continue
+                current = results[i]
+                if current is None:
+                    current = results[i] = DiagnosticResult(
+                        file_uri=files[i][0], diagnostics=[]
+                    )
+                append = current.diagnostics.append
+                continue
+            if append is None:
+                continue
+            diagnostic = parse_line(line)
+            if diagnostic is not None:
+                append(diagnostic)
+
+        return results
 
-        # Parse output
-        diagnostics = self._parse_output(output)
+    def _cache_key(self, file_uri: str, file_path: str) -> Tuple[str, bytes]:
+        """
+        Build result cache key from file URI and content.
 
-        logger.debug(f"Found {len(diagnostics)} diagnostics")
-        return DiagnosticResult(file_uri=file_uri, diagnostics=diagnostics)
+        The file is only read and hashed when its mtime or size changed
+        since the previous call for the same URI.
+
+        Args:
+            file_uri (str): URI of file
+            file_path (str): Local path to the file
 
-    def _parse_output(self, output: str) -> List[Dict[str, Any]]:
+        Returns:
+            Tuple[str, bytes]: (file_uri, content digest)
+        """
+        st = os.stat(file_path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._cache_lock:
+            known = self._digest_by_uri.get(file_uri)
+            if known is not None and known[:2] == stamp:
+                self._digest_by_uri.move_to_end(file_uri)
+                return (file_uri, known[2])
+
+        # Hash outside the lock; concurrent callers may both hash
+        with open(file_path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+        with self._cache_lock:
+            self._digest_by_uri[file_uri] = (*stamp, digest)
+            self._digest_by_uri.move_to_end(file_uri)
+            if len(self._digest_by_uri) > self.RESULT_CACHE_SIZE:
+                self._digest_by_uri.popitem(last=False)
+        return (file_uri, digest)
+
+    def _get_cached_result(
+        self, cache_key: Tuple[str, bytes]
+    ) -> Optional[DiagnosticResult]:
         """
-        Parse mlint output into structured diagnostics.
+        Get cached result for unchanged file content.
 
         Args:
-            output (str): Raw output from mlint.exe
+            cache_key (Tuple[str, bytes]): Key from _cache_key()
 
         Returns:
-            List[Dict]: List of diagnostic dictionaries
+            Optional[DiagnosticResult]: Cached result or None
         """
-        diagnostics = []
+        with self._cache_lock:
+            result = self._result_cache.get(cache_key)
+            if result is not None:
+                self._result_cache.move_to_end(cache_key)
+        if result is not None:
+            logger.debug("Using cached diagnostics for: %s", cache_key[0])
+        return result
+
+    def _cache_result(
+        self, cache_key: Tuple[str, bytes], result: DiagnosticResult
+    ) -> None:
+        """
+        Store analysis result, evicting the least recently used one.
 
-        for line in output.split("\n"):
-            line = line.strip()
-            if not line:
-                continue
-            # Skip mlint header lines
-            # (e.g., "========== path/to/file.m ==========")
-            if line.startswith("=========="):
-                continue
+        Args:
+            cache_key (Tuple[str, bytes]): Key from _cache_key()
+            result (DiagnosticResult): Analysis result
+        """
+        with self._cache_lock:
+            self._result_cache[cache_key] = result
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
 
-            # Try to match patterns
-            match = None
-            msg_id = ""
-            message = ""
-
-            # Try pattern with ID first: "L line (ID): message"
-            match = self.MLINT_PATTERN_WITH_ID.match(line)
-            if match:
-                line_num = int(match.group(1))
-                msg_id_from_match = match.group(2) if match.group(2) else ""
-                message = match.group(3)
-                msg_id = msg_id_from_match
-            else:
-                # Try simple pattern: "L line: message"
-                match = self.MLINT_PATTERN_SIMPLE.match(line)
-                if match:
-                    line_num = int(match.group(1))
-                    message = match.group(2)
-
-            if match:
-                # Map message ID to severity
-                severity = self._map_severity(msg_id)
-
-                diagnostic = {
-                    "line": line_num,
-                    "column": 1,  # Default to column 1
-                    "message": message,
-                    "severity": severity,
-                    "code": msg_id,
-                    "source": "mlint",
-                }
-                diagnostics.append(diagnostic)
-
-        return diagnostics
-
-    def _map_severity(self, msg_id: str) -> str:
+    def _check_can_analyze(self, file_paths: List[str]) -> str:
         """
-        Map mlint message ID to LSP severity level.
+        Check files exist and mlint is available.
 
         Args:
-            msg_id (str): mlint message ID (e.g., "C", "W")
+            file_paths (List[str]): Local paths of files to analyze
 
         Returns:
-            str: LSP severity ("error", "warning", "info")
+            str: Path to mlint executable
+
+        Raises:
+            FileNotFoundError: If a file does not exist
+            RuntimeError: If mlint is not available
         """
-        # Common mlint message prefixes
-        error_prefixes = ["E", "F"]  # Error, Fatal
-        warning_prefixes = ["C", "W"]  # Code Analyzer, Warning
-        info_prefixes = ["I"]  # Info
+        for file_path in file_paths:
+            if not os.path.exists(file_path):
+                logger.error("File not found: %s", file_path)
+                raise FileNotFoundError(f"File not found: {file_path}")
 
-        if not msg_id:
-            # Default to warning for unknown IDs
-            return "warning"
+        if not self.is_available() or self.mlint_path is None:
+            raise RuntimeError("mlint.exe is not available")
+        return self.mlint_path
 
-        msg_id_upper = msg_id.upper()
+    def _run_mlint(self, file_paths: List[str]) -> Iterator[bytes]:
+        """
+        Run mlint and yield its raw output lines as they are produced.
 
-        if any(msg_id_upper.startswith(prefix) for prefix in error_prefixes):
-            return "error"
-        elif any(
-            msg_id_upper.startswith(prefix) for prefix in warning_prefixes
-        ):
-            return "warning"
-        elif any(msg_id_upper.startswith(prefix) for prefix in info_prefixes):
-            return "info"
-        else:
-            return "warning"
+        Args:
+            file_paths (List[str]): Local paths of files to analyze
+
+        Yields:
+            bytes: Undecoded lines of mlint output
+        """
+        # Assert mlint_path is not None (mypy doesn't narrow type from is_available)
+        assert (
+            self.mlint_path is not None
+        ), "mlint_path should be set if is_available() is True"
+
+        # mlint returns non-zero if issues are found - this is expected,
+        # so the exit code is not checked. Diagnostics go to stderr (some
+        # builds use stdout); merge both and parse lines as they arrive.
+        proc = subprocess.Popen(
+            [self.mlint_path, *file_paths, "-id"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=65536,
+            **_SUBPROCESS_KWARGS,
+        )
+        with proc:
+            assert proc.stdout is not None
+            yield from proc.stdout
+
+    def _parse_line(self, line: bytes) -> Optional[AnalyzerDiagnostic]:
+        """
+        Parse a single line of mlint output.
+
+        Only the captured ID and message are decoded, not the whole line.
+
+        Args:
+            line (bytes): One undecoded line of mlint output
+
+        Returns:
+            Optional[AnalyzerDiagnostic]: Diagnostic, or None if the line
+                is not a diagnostic
+        """
+        # Every diagnostic starts with "L"; this rejects blank lines and
+        # headers (e.g., "========== path/to/file.m ==========") without
+        # entering the regex engine
+        if line[:1] != b"L":
+            return None
+
+        match = self._match_line(line)
+        if not match:
+            return None
+        line_num = int(match.group(1))
+        msg_id = _decode(match.group(2)) if match.group(2) else ""
+        message = _decode(match.group(3).rstrip())
+
+        return AnalyzerDiagnostic(
+            line=line_num,
+            column=1,  # Default to column 1
+            message=message,
+            # Map message ID to severity; warning for empty/unknown IDs
+            severity=self._SEVERITY_BY_CHAR.get(
+                msg_id[:1], DiagnosticSeverity.Warning
+            ),
+            code=msg_id,
+            source="mlint",
+        )
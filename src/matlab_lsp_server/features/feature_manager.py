@@ -144,10 +144,12 @@ class FeatureManager:
         """
         Get the configured server capabilities.
 
+        The object is built once in __init__ and updated in place by the
+        enable/disable methods, so every call returns the same instance.
+
         Returns:
             ServerCapabilities: The LSP server capabilities object
         """
-        logger.debug("Returning server capabilities")
         return self._capabilities
 
     def enable_all_features(self):
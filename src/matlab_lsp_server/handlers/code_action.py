@@ -5,7 +5,8 @@ This module implements textDocument/codeAction to provide
 quick fixes for MATLAB code issues.
 """
 
-from typing import List
+import re
+from typing import Dict, List, Optional, Tuple
 
 from lsprotocol.types import CodeAction, CodeActionKind, Diagnostic
 from pygls.lsp.server import LanguageServer
@@ -14,6 +15,50 @@ from matlab_lsp_server.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_CREATE_STUB_FIX = {
+    "title": "Create function stub",
+    "edit": None,  # Would need to generate code
+}
+_ADD_SEMICOLON_FIX = {
+    "title": "Add semicolon",
+    "edit": None,  # Would need to add semicolon
+}
+_REMOVE_VARIABLE_FIX = {
+    "title": "Remove variable",
+    "edit": None,  # Would need to remove line
+}
+_ADD_END_FIX = {
+    "title": "Add end statement",
+    "edit": None,  # Would need to add end
+}
+
+# Quick fixes by mlint message ID (reported with "mlint -id")
+_QUICK_FIXES_BY_ID: Dict[str, Tuple[dict, ...]] = {
+    "NOPTS": (_ADD_SEMICOLON_FIX,),
+    "NASGU": (_REMOVE_VARIABLE_FIX,),
+    "ASGLU": (_REMOVE_VARIABLE_FIX,),
+}
+
+# Fallback for diagnostics without a known message ID: (substring, fix)
+_QUICK_FIXES_BY_PATTERN: Tuple[Tuple[str, dict], ...] = (
+    ("undefined function", _CREATE_STUB_FIX),
+    ("semicolon", _ADD_SEMICOLON_FIX),
+    ("unused", _REMOVE_VARIABLE_FIX),
+    ("end of input", _ADD_END_FIX),
+)
+
+# Message ID prefix of "mlint -id" messages, e.g. "NOPTS: Terminate ..."
+_MESSAGE_ID_PATTERN = re.compile(r"([A-Z][A-Z0-9]*):")
+
+
+def _message_id(diagnostic: Diagnostic) -> Optional[str]:
+    """Get the mlint message ID of a diagnostic, if it has one."""
+    code = diagnostic.code
+    if isinstance(code, str) and code in _QUICK_FIXES_BY_ID:
+        return code
+    match = _MESSAGE_ID_PATTERN.match(diagnostic.message)
+    return match.group(1) if match else None
+
 
 class CodeActionHandler:
     """Handler for code actions (quick fixes) in MATLAB LSP server."""
@@ -40,8 +85,9 @@ class CodeActionHandler:
             List[CodeAction]: List of code actions
         """
         logger.debug(
-            f"Providing code actions for {file_uri}: "
-            f"{len(diagnostics)} diagnostics"
+            "Providing code actions for %s: %d diagnostics",
+            file_uri,
+            len(diagnostics),
         )
 
         code_actions = []
@@ -62,7 +108,7 @@ class CodeActionHandler:
                 )
                 code_actions.append(action)
 
-        logger.debug(f"Returning {len(code_actions)} code actions")
+        logger.debug("Returning %d code actions", len(code_actions))
 
         return code_actions
 
@@ -108,47 +154,17 @@ class CodeActionHandler:
         Returns:
             List[dict]: List of fix suggestions
         """
-        # Check diagnostic message for common patterns
-        message = diagnostic.message.lower()
-        fixes = []
-
-        # Pattern 1: "Undefined function 'xxx'"
-        if "undefined function" in message:
-            fixes.append(
-                {
-                    "title": "Create function stub",
-                    "edit": None,  # Would need to generate code
-                }
-            )
-
-        # Pattern 2: "Missing semicolon"
-        if "semicolon" in message:
-            fixes.append(
-                {
-                    "title": "Add semicolon",
-                    "edit": None,  # Would need to add semicolon
-                }
-            )
-
-        # Pattern 3: "Variable 'xxx' may be unused"
-        if "unused" in message:
-            fixes.append(
-                {
-                    "title": "Remove variable",
-                    "edit": None,  # Would need to remove line
-                }
-            )
-
-        # Pattern 4: "End of input"
-        if "end of input" in message:
-            fixes.append(
-                {
-                    "title": "Add end statement",
-                    "edit": None,  # Would need to add end
-                }
-            )
+        fixes = _QUICK_FIXES_BY_ID.get(_message_id(diagnostic) or "")
+        if fixes is not None:
+            return [dict(fix) for fix in fixes]
 
-        return fixes
+        # No or unknown message ID: check message for common patterns
+        message = diagnostic.message.lower()
+        return [
+            dict(fix)
+            for pattern, fix in _QUICK_FIXES_BY_PATTERN
+            if pattern in message
+        ]
 
     def apply_code_action(
         self, server: LanguageServer, file_uri: str, action: CodeAction
@@ -161,9 +177,7 @@ class CodeActionHandler:
             file_uri (str): File URI
             action (CodeAction): Code action to apply
         """
-        logger.debug(
-            f"Applying code action for {file_uri}: " f"{action.title}"
-        )
+        logger.debug("Applying code action for %s: %s", file_uri, action.title)
 
         # Apply the edit
         if action.edit:
@@ -175,8 +189,9 @@ class CodeActionHandler:
                 else []
             )
             logger.info(
-                f"Applying edit to {file_uri}: "
-                f"{len(document_changes)} changes"
+                "Applying edit to %s: %d changes",
+                file_uri,
+                len(document_changes),
             )
 
 
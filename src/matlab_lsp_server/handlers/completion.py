@@ -5,7 +5,9 @@ This module implements textDocument/completion to provide
 code completion suggestions for MATLAB code.
 """
 
-from typing import Any, Dict, List, Optional
+import heapq
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
 
 from lsprotocol.types import CompletionItem, CompletionItemKind, CompletionList
 from pygls.lsp.server import LanguageServer
@@ -15,6 +17,15 @@ from matlab_lsp_server.utils.symbol_table import Symbol, SymbolTable, get_symbol
 
 logger = get_logger(__name__)
 
+# LSP CompletionItemKind by symbol table kind
+_COMPLETION_KINDS = {
+    "function": CompletionItemKind.Function,
+    "method": CompletionItemKind.Method,
+    "class": CompletionItemKind.Class,
+    "variable": CompletionItemKind.Variable,
+    "property": CompletionItemKind.Property,
+}
+
 
 class CompletionHandler:
     """Handler for code completion in MATLAB LSP server."""
@@ -95,6 +106,15 @@ class CompletionHandler:
         },
     }
 
+    # (lowercased name, name, info) for each built-in, for filtering
+    _BUILTIN_ENTRIES = tuple(
+        (name.lower(), name, info)
+        for name, info in BUILTIN_COMPLETIONS.items()
+    )
+
+    # Maximum number of completion items returned per request
+    MAX_RESULTS = 20
+
     def __init__(self, symbol_table: Optional[SymbolTable] = None):
         """Initialize completion handler.
 
@@ -134,9 +154,11 @@ class CompletionHandler:
         )
 
         logger.debug(
-            f"Providing completion for {file_uri}:"
-            f"({line}:{character}) "
-            f"prefix: '{prefix}'"
+            "Providing completion for %s:(%d:%d) prefix: '%s'",
+            file_uri,
+            line,
+            character,
+            prefix,
         )
 
         # Collect completion candidates
@@ -151,14 +173,13 @@ class CompletionHandler:
         # 2. Add built-in MATLAB functions and keywords
         candidates.extend(self._create_completion_items_from_builtins(prefix))
 
-        # 3. Rank candidates by relevance
-        ranked_candidates = self._rank_candidates(candidates, prefix)
-
-        # Limit to top 20 results
-        limited_candidates = ranked_candidates[:20]
+        # 3. Rank candidates by relevance, keeping only the top results
+        limited_candidates = self._rank_candidates(
+            candidates, prefix, limit=self.MAX_RESULTS
+        )
 
         logger.debug(
-            f"Returning {len(limited_candidates)} completion candidates"
+            "Returning %d completion candidates", len(limited_candidates)
         )
 
         return CompletionList(
@@ -180,10 +201,11 @@ class CompletionHandler:
             List[CompletionItem]: List of completion items
         """
         items = []
+        prefix_lower = prefix.lower()
 
         for symbol in symbols:
             # Filter by prefix (case-insensitive)
-            if prefix and prefix.lower() not in symbol.name.lower():
+            if prefix and prefix_lower not in symbol.name_lower:
                 continue
 
             # Determine kind based on symbol type
@@ -220,10 +242,11 @@ class CompletionHandler:
             List[CompletionItem]: List of completion items
         """
         items = []
+        prefix_lower = prefix.lower()
 
-        for name, info in self.BUILTIN_COMPLETIONS.items():
+        for name_lower, name, info in self._BUILTIN_ENTRIES:
             # Filter by prefix (case-insensitive)
-            if prefix and prefix.lower() not in name.lower():
+            if prefix and prefix_lower not in name_lower:
                 continue
 
             # Create completion item
@@ -244,7 +267,10 @@ class CompletionHandler:
         return items
 
     def _rank_candidates(
-        self, candidates: List[CompletionItem], prefix: str
+        self,
+        candidates: List[CompletionItem],
+        prefix: str,
+        limit: Optional[int] = None,
     ) -> List[CompletionItem]:
         """
         Rank completion candidates by relevance.
@@ -257,46 +283,47 @@ class CompletionHandler:
         Args:
             candidates (List[CompletionItem]): Completion candidates
             prefix (str): Word prefix
+            limit (Optional[int]): Maximum number of items to return;
+                only these are ordered, instead of sorting all candidates
 
         Returns:
             List[CompletionItem]: Ranked completion items
         """
         if not prefix:
-            return candidates
+            return candidates[:limit]
 
-        # Ensure sort_text is not None for sorting
-        for candidate in candidates:
-            label_lower = candidate.label.lower()
-            prefix_lower = prefix.lower()
+        prefix_lower = prefix.lower()
 
+        def rank_key(candidate: CompletionItem) -> Tuple[int, str]:
+            label_lower = candidate.label.lower()
             # Exact match (highest score)
             if label_lower == prefix_lower:
-                candidate.sort_text = f"0:{candidate.label}"
+                return (0, candidate.label)
             # Prefix match at start
-            elif label_lower.startswith(prefix_lower):
-                candidate.sort_text = f"1:{candidate.label}"
+            if label_lower.startswith(prefix_lower):
+                return (1, candidate.label)
             # Partial match anywhere (lower score)
-            else:
-                candidate.sort_text = f"2:{candidate.label}"
+            return (2, candidate.label)
+
+        # Sort by relevance on (rank, label) keys, computed once each
+        keyed = [(rank_key(candidate), candidate) for candidate in candidates]
+        if limit is not None and limit < len(keyed):
+            # Stable like sorted(...)[:limit], without a full sort
+            keyed = heapq.nsmallest(limit, keyed, key=itemgetter(0))
+        else:
+            keyed.sort(key=itemgetter(0))
 
-        # Sort by relevance (sort_text)
-        # Use str() to handle Optional[str]
-        ranked = sorted(candidates, key=lambda x: str(x.sort_text))
+        # Clients order items by sort_text, so encode the rank there
+        for (rank, label), candidate in keyed:
+            candidate.sort_text = f"{rank}:{label}"
 
-        return ranked
+        return [candidate for _, candidate in keyed]
 
     def _map_symbol_kind_to_completion_kind(
         self, symbol_kind: str
     ) -> CompletionItemKind:
         """Map symbol kind to LSP CompletionItemKind."""
-        kind_map = {
-            "function": CompletionItemKind.Function,
-            "method": CompletionItemKind.Method,
-            "class": CompletionItemKind.Class,
-            "variable": CompletionItemKind.Variable,
-            "property": CompletionItemKind.Property,
-        }
-        return kind_map.get(symbol_kind, CompletionItemKind.Variable)
+        return _COMPLETION_KINDS.get(symbol_kind, CompletionItemKind.Variable)
 
 
 # Global completion handler instance
@@ -19,6 +19,9 @@ logger = get_logger(__name__)
 class DefinitionHandler:
     """Handler for go-to-definition in MATLAB LSP server."""
 
+    # Allowed distance in lines between a symbol and the cursor
+    LINE_TOLERANCE = 5
+
     def __init__(self, symbol_table: Optional[SymbolTable] = None):
         """Initialize definition handler.
 
@@ -50,33 +53,42 @@ class DefinitionHandler:
             Optional[Location]: Definition location if found
         """
         logger.debug(
-            f"Providing definition for {file_uri}:"
-            f"({position.line}:{position.character}) "
-            f"word: '{word}'"
+            "Providing definition for %s:(%d:%d) word: '%s'",
+            file_uri,
+            position.line,
+            position.character,
+            word,
         )
 
         if not word or len(word) == 0:
             return None
 
-        # Search for symbol in current file
-        file_symbols = self._symbol_table.get_symbols_by_uri(file_uri)
+        # Search for symbol near the cursor in current file
+        cursor_line = position.line + 1  # Convert from 0-based to 1-based
+        file_symbols = self._symbol_table.get_symbols_in_line_range(
+            file_uri,
+            cursor_line - self.LINE_TOLERANCE,
+            cursor_line + self.LINE_TOLERANCE,
+        )
         symbol = self._find_symbol_at_position(file_symbols, position, word)
 
         if not symbol:
             # Also search in all files
-            all_symbols = self._symbol_table.get_all_symbols()
-            symbol = self._find_symbol_by_name(all_symbols, word)
+            symbol = self._find_symbol_by_name(word)
 
         if not symbol:
-            logger.debug(f"No definition found for '{word}'")
+            logger.debug("No definition found for '%s'", word)
             return None
 
         # Create location
         location = self._create_location(symbol)
 
         logger.debug(
-            f"Definition for '{word}': "
-            f"{symbol.uri}:{symbol.line}:{symbol.column}"
+            "Definition for '%s': %s:%d:%d",
+            word,
+            symbol.uri,
+            symbol.line,
+            symbol.column,
         )
 
         return location
@@ -97,36 +109,32 @@ class DefinitionHandler:
         """
         # Find symbol matching word at position
         cursor_line = position.line + 1  # Convert from 0-based to 1-based
+        word_lower = word.lower()
 
         for symbol in symbols:
             # Check if symbol name matches word
-            if symbol.name.lower() != word.lower():
+            if symbol.name_lower != word_lower:
                 continue
 
             # Check if symbol is close to cursor position
             # Allow some tolerance for multi-line functions
-            if abs(symbol.line - cursor_line) <= 5:
+            if abs(symbol.line - cursor_line) <= self.LINE_TOLERANCE:
                 return symbol
 
         return None
 
-    def _find_symbol_by_name(
-        self, symbols: List[Symbol], name: str
-    ) -> Optional[Symbol]:
+    def _find_symbol_by_name(self, name: str) -> Optional[Symbol]:
         """
-        Find symbol by name (case-insensitive).
+        Find symbol by name (case-insensitive) in all files.
 
         Args:
-            symbols (list): List of symbols
             name (str): Symbol name
 
         Returns:
             Optional[Symbol]: First matching symbol
         """
-        for symbol in symbols:
-            if symbol.name.lower() == name.lower():
-                return symbol
-        return None
+        symbols = self._symbol_table.get_symbols_by_lower_name(name.lower())
+        return symbols[0] if symbols else None
 
     def _create_location(self, symbol: Symbol) -> Location:
         """
@@ -177,23 +185,20 @@ class DefinitionHandler:
         Returns:
             List[Location]: List of definition locations
         """
-        logger.debug(f"Providing definitions for '{word}'")
+        logger.debug("Providing definitions for '%s'", word)
 
         if not word or len(word) == 0:
             return []
 
-        # Search for all matching symbols
-        all_symbols = self._symbol_table.get_all_symbols()
-
-        # Find all symbols matching name (case-insensitive)
-        matching_symbols = [
-            s for s in all_symbols if s.name.lower() == word.lower()
+        # Create locations for all symbols matching name (case-insensitive)
+        locations = [
+            self._create_location(s)
+            for s in self._symbol_table.get_symbols_by_lower_name(
+                word.lower()
+            )
         ]
 
-        # Create locations for all matches
-        locations = [self._create_location(s) for s in matching_symbols]
-
-        logger.debug(f"Found {len(locations)} definitions for '{word}'")
+        logger.debug("Found %d definitions for '%s'", len(locations), word)
 
         return locations
 
@@ -5,11 +5,12 @@ This module handles textDocument/publishDiagnostics notifications
 to publish analysis results to LSP client.
 """
 
-from typing import List
+import asyncio
+import functools
+from typing import Dict, List, Optional, Set, Tuple
 
 from lsprotocol.types import (
     Diagnostic,
-    DiagnosticSeverity,
     Position,
     PublishDiagnosticsParams,
     Range,
@@ -34,43 +35,30 @@ def mlint_result_to_lsp_diagnostics(
     Returns:
         List[Diagnostic]: List of LSP Diagnostic objects
     """
-    diagnostics = []
-
-    for diag_dict in result.diagnostics:
-        # Map severity string to LSP DiagnosticSeverity
-        severity_map = {
-            "error": DiagnosticSeverity.Error,
-            "warning": DiagnosticSeverity.Warning,
-            "info": DiagnosticSeverity.Information,
-        }
-        severity = severity_map.get(
-            diag_dict["severity"], DiagnosticSeverity.Warning
-        )
+    if result.lsp_diagnostics is not None:
+        # Unchanged content: the analyzer handed back its cached result
+        return result.lsp_diagnostics
 
-        # Create LSP Range
-        line = max(0, diag_dict["line"] - 1)  # LSP is 0-based
-        column = (
-            max(0, diag_dict["column"] - 1) if diag_dict["column"] > 0 else 0
-        )
-
-        diagnostic_range = Range(
-            start=Position(line=line, character=column),
-            end=Position(line=line, character=column + 1),
-        )
-
-        # Create LSP Diagnostic
-        diagnostic = Diagnostic(
-            range=diagnostic_range,
-            message=diag_dict["message"],
-            severity=severity,
-            code=diag_dict["code"],
-            source=diag_dict["source"],
+    diagnostics = []
+    for diag in result.diagnostics:
+        # LSP is 0-based
+        line = diag.line - 1 if diag.line > 0 else 0
+        column = diag.column - 1 if diag.column > 0 else 0
+        diagnostics.append(
+            Diagnostic(
+                range=Range(
+                    start=Position(line=line, character=column),
+                    end=Position(line=line, character=column + 1),
+                ),
+                message=diag.message,
+                severity=diag.severity,
+                code=diag.code,
+                source=diag.source,
+            )
         )
-        diagnostics.append(diagnostic)
 
-    logger.debug(
-        f"Converted {len(result.diagnostics)} diagnostics to LSP format"
-    )
+    result.lsp_diagnostics = diagnostics
+    logger.debug("Converted %d diagnostics to LSP format", len(diagnostics))
     return diagnostics
 
 
@@ -89,24 +77,307 @@ def publish_diagnostics(
         analyzer (BaseAnalyzer): Analyzer instance (e.g., MlintAnalyzer)
         file_path (str): Local path to file
     """
-    logger.debug(f"Publishing diagnostics for: {file_path}")
+    logger.debug("Publishing diagnostics for: %s", file_path)
 
     try:
         # Run analyzer
         result = analyzer.analyze(file_uri=file_uri, file_path=file_path)
+        _publish_result(server, file_uri, file_path, result)
 
-        # Convert to LSP diagnostics
-        lsp_diagnostics = mlint_result_to_lsp_diagnostics(result)
+    except FileNotFoundError:
+        logger.warning("File not found, skipping diagnostics: %s", file_path)
+    except Exception as e:
+        logger.error("Error analyzing file %s: %s", file_path, e)
 
-        # Publish to client
-        params = PublishDiagnosticsParams(uri=file_uri, diagnostics=lsp_diagnostics)
-        server.text_document_publish_diagnostics(params)
 
-        logger.info(
-            f"Published {len(lsp_diagnostics)} diagnostics for {file_path}"
-        )
+async def publish_diagnostics_async(
+    server: LanguageServer,
+    file_uri: str,
+    analyzer: BaseAnalyzer,
+    file_path: str,
+) -> None:
+    """
+    Analyze file without blocking the event loop and publish diagnostics.
 
+    Args:
+        server (LanguageServer): LSP server instance
+        file_uri (str): URI of file to analyze
+        analyzer (BaseAnalyzer): Analyzer instance (e.g., MlintAnalyzer)
+        file_path (str): Local path to file
+    """
+    logger.debug("Publishing diagnostics for: %s", file_path)
+
+    result = await _analyze_async(file_uri, analyzer, file_path)
+    if result is not None:
+        _publish_result(server, file_uri, file_path, result)
+
+
+async def _analyze_async(
+    file_uri: str,
+    analyzer: BaseAnalyzer,
+    file_path: str,
+) -> Optional[DiagnosticResult]:
+    """
+    Analyze file without blocking the event loop, logging failures.
+
+    Args:
+        file_uri (str): URI of file to analyze
+        analyzer (BaseAnalyzer): Analyzer instance (e.g., MlintAnalyzer)
+        file_path (str): Local path to file
+
+    Returns:
+        Optional[DiagnosticResult]: Analysis result, or None on failure
+    """
+    try:
+        return await analyzer.analyze_async(file_uri, file_path)
     except FileNotFoundError:
-        logger.warning(f"File not found, skipping diagnostics: {file_path}")
+        logger.warning("File not found, skipping diagnostics: %s", file_path)
     except Exception as e:
-        logger.error(f"Error analyzing file {file_path}: {e}")
+        logger.error("Error analyzing file %s: %s", file_path, e)
+    return None
+
+
+def _publish_result(
+    server: LanguageServer,
+    file_uri: str,
+    file_path: str,
+    result: DiagnosticResult,
+) -> None:
+    """
+    Convert analysis result and publish it to client.
+
+    Args:
+        server (LanguageServer): LSP server instance
+        file_uri (str): URI of analyzed file
+        file_path (str): Local path to file
+        result (DiagnosticResult): Analysis result
+    """
+    # Convert to LSP diagnostics
+    lsp_diagnostics = mlint_result_to_lsp_diagnostics(result)
+
+    # Publish to client
+    params = PublishDiagnosticsParams(uri=file_uri, diagnostics=lsp_diagnostics)
+    server.text_document_publish_diagnostics(params)
+
+    logger.info(
+        "Published %d diagnostics for %s", len(lsp_diagnostics), file_path
+    )
+
+
+class DiagnosticsScheduler:
+    """Debounces analysis requests per document.
+
+    Rapid requests for the same URI are coalesced into one analysis run
+    after a short delay. Analyses run as tasks via analyze_async(), so
+    the event loop is not blocked by the analyzer subprocess and
+    different files can be analyzed in parallel. Files that become due
+    at the same time (e.g. documents opened before the analyzer was
+    ready) are analyzed together with analyze_many().
+
+    Each request gets a generation number; results are only published
+    if no newer request or cancellation for the URI happened meanwhile.
+    """
+
+    def __init__(self) -> None:
+        """Initialize DiagnosticsScheduler."""
+        self._pending: Dict[str, asyncio.TimerHandle] = {}
+        # Due analyses collected until the next event loop iteration
+        self._due: Dict[
+            str, Tuple[LanguageServer, BaseAnalyzer, str, int]
+        ] = {}
+        # Strong references to running analyses
+        self._running: Set[asyncio.Task] = set()
+        # Running single-file analysis by URI, cancelled when replaced
+        self._tasks: Dict[str, asyncio.Task] = {}
+        # Latest generation by URI with analysis pending or in flight
+        self._generations: Dict[str, int] = {}
+        self._next_generation = 0
+
+    def schedule(
+        self,
+        server: LanguageServer,
+        file_uri: str,
+        analyzer: BaseAnalyzer,
+        file_path: str,
+        delay: float = 0.2,
+    ) -> None:
+        """
+        Schedule analysis of a file, replacing any pending request.
+
+        Must be called from the event loop thread.
+
+        Args:
+            server (LanguageServer): LSP server instance
+            file_uri (str): URI of file to analyze
+            analyzer (BaseAnalyzer): Analyzer instance (e.g., MlintAnalyzer)
+            file_path (str): Local path to file
+            delay (float): Debounce delay in seconds
+        """
+        self.cancel(file_uri)
+        generation = self._next_generation
+        self._next_generation += 1
+        self._generations[file_uri] = generation
+        loop = asyncio.get_running_loop()
+        self._pending[file_uri] = loop.call_later(
+            delay,
+            self._start,
+            server,
+            file_uri,
+            analyzer,
+            file_path,
+            generation,
+        )
+
+    def cancel(self, file_uri: str) -> None:
+        """
+        Cancel pending or running analysis of a file, if any.
+
+        Results of batch analyses already running for the file are
+        discarded instead of published.
+
+        Args:
+            file_uri (str): URI of file
+        """
+        handle = self._pending.pop(file_uri, None)
+        if handle is not None:
+            handle.cancel()
+        self._due.pop(file_uri, None)
+        self._generations.pop(file_uri, None)
+        task = self._tasks.pop(file_uri, None)
+        if task is not None:
+            task.cancel()
+
+    def _start(
+        self,
+        server: LanguageServer,
+        file_uri: str,
+        analyzer: BaseAnalyzer,
+        file_path: str,
+        generation: int,
+    ) -> None:
+        """Mark an analysis as due; due analyses start together."""
+        self._pending.pop(file_uri, None)
+        if not self._due:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._due[file_uri] = (server, analyzer, file_path, generation)
+
+    def _flush(self) -> None:
+        """Start due analyses, batching files that share an analyzer."""
+        batches: Dict[
+            int,
+            Tuple[LanguageServer, BaseAnalyzer, List[Tuple[str, str, int]]],
+        ] = {}
+        for file_uri, (server, analyzer, path, gen) in self._due.items():
+            batch = batches.setdefault(id(analyzer), (server, analyzer, []))
+            batch[2].append((file_uri, path, gen))
+        self._due.clear()
+
+        for server, analyzer, files in batches.values():
+            if len(files) == 1:
+                file_uri, file_path, generation = files[0]
+                task = asyncio.create_task(
+                    self._run_one(
+                        server, file_uri, analyzer, file_path, generation
+                    )
+                )
+                self._tasks[file_uri] = task
+                task.add_done_callback(
+                    functools.partial(self._forget_task, file_uri)
+                )
+            else:
+                task = asyncio.create_task(
+                    self._run_batch(server, analyzer, files)
+                )
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _forget_task(self, file_uri: str, task: asyncio.Task) -> None:
+        """Drop a finished task, unless it was already replaced."""
+        if self._tasks.get(file_uri) is task:
+            del self._tasks[file_uri]
+
+    async def _run_one(
+        self,
+        server: LanguageServer,
+        file_uri: str,
+        analyzer: BaseAnalyzer,
+        file_path: str,
+        generation: int,
+    ) -> None:
+        """Analyze one file and publish the result if still current."""
+        result = await _analyze_async(file_uri, analyzer, file_path)
+        if result is not None:
+            self._publish_if_current(
+                server, file_uri, file_path, result, generation
+            )
+
+    async def _run_batch(
+        self,
+        server: LanguageServer,
+        analyzer: BaseAnalyzer,
+        files: List[Tuple[str, str, int]],
+    ) -> None:
+        """Analyze several files at once and publish the results."""
+        logger.debug("Triggering batch analysis for %d files", len(files))
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                None,
+                analyzer.analyze_many,
+                [(file_uri, file_path) for file_uri, file_path, _ in files],
+            )
+        except Exception as e:
+            # Fall back to concurrent per-file analysis to isolate the
+            # failing file
+            logger.debug("Batch analysis failed, analyzing separately: %s", e)
+            await asyncio.gather(
+                *(
+                    self._run_one(
+                        server, file_uri, analyzer, file_path, generation
+                    )
+                    for file_uri, file_path, generation in files
+                )
+            )
+            return
+
+        for (file_uri, file_path, generation), result in zip(files, results):
+            self._publish_if_current(
+                server, file_uri, file_path, result, generation
+            )
+
+    def _publish_if_current(
+        self,
+        server: LanguageServer,
+        file_uri: str,
+        file_path: str,
+        result: DiagnosticResult,
+        generation: int,
+    ) -> None:
+        """
+        Publish a result unless the file was closed or re-scheduled.
+
+        Args:
+            server (LanguageServer): LSP server instance
+            file_uri (str): URI of analyzed file
+            file_path (str): Local path to file
+            result (DiagnosticResult): Analysis result
+            generation (int): Generation the analysis was started for
+        """
+        if self._generations.get(file_uri) != generation:
+            logger.debug("Discarding stale diagnostics for %s", file_path)
+            return
+        del self._generations[file_uri]
+        _publish_result(server, file_uri, file_path, result)
+
+
+# Global diagnostics scheduler instance
+_diagnostics_scheduler = None
+
+
+def get_diagnostics_scheduler() -> DiagnosticsScheduler:
+    """Get or create global DiagnosticsScheduler instance."""
+    global _diagnostics_scheduler
+    if _diagnostics_scheduler is None:
+        _diagnostics_scheduler = DiagnosticsScheduler()
+        logger.debug("DiagnosticsScheduler instance created")
+    return _diagnostics_scheduler
@@ -5,7 +5,8 @@ This module implements textDocument/documentSymbol to provide
 hierarchical document structure (outline) for MATLAB files.
 """
 
-from typing import List, Optional
+from collections import OrderedDict, defaultdict
+from typing import Dict, List, Optional, Tuple
 
 from lsprotocol.types import DocumentSymbol, Position, Range, SymbolKind
 from pygls.lsp.server import LanguageServer
@@ -15,10 +16,22 @@ from matlab_lsp_server.utils.symbol_table import Symbol, SymbolTable, get_symbol
 
 logger = get_logger(__name__)
 
+# LSP SymbolKind by symbol table kind
+_SYMBOL_KINDS = {
+    "function": SymbolKind.Function,
+    "method": SymbolKind.Method,
+    "class": SymbolKind.Class,
+    "variable": SymbolKind.Variable,
+    "property": SymbolKind.Property,
+}
+
 
 class DocumentSymbolHandler:
     """Handler for document symbols in MATLAB LSP server."""
 
+    # Maximum number of cached document outlines
+    RESULT_CACHE_SIZE = 64
+
     def __init__(self, symbol_table: Optional[SymbolTable] = None):
         """Initialize document symbol handler.
 
@@ -28,6 +41,11 @@ class DocumentSymbolHandler:
         self._symbol_table = (
             symbol_table if symbol_table else get_symbol_table()
         )
+        # LRU of outlines by URI, with the symbol table version each was
+        # built from
+        self._cache: OrderedDict[
+            str, Tuple[int, List[DocumentSymbol]]
+        ] = OrderedDict()
         logger.debug("DocumentSymbolHandler initialized")
 
     def provide_document_symbols(
@@ -45,18 +63,38 @@ class DocumentSymbolHandler:
         Returns:
             List[DocumentSymbol]: Hierarchical document symbols
         """
-        logger.debug(f"Providing document symbols for {file_uri}")
+        logger.debug("Providing document symbols for %s", file_uri)
+
+        # Reuse the outline while the file's symbols are unchanged
+        version = self._symbol_table.get_uri_version(file_uri)
+        cached = self._cache.get(file_uri)
+        if cached is not None and cached[0] == version:
+            self._cache.move_to_end(file_uri)
+            return cached[1]
 
         # Get symbols from table
         file_symbols = self._symbol_table.get_symbols_by_uri(file_uri)
 
         # Convert to DocumentSymbol format with hierarchy
         document_symbols = self._create_document_symbols(file_symbols)
+        self._cache[file_uri] = (version, document_symbols)
+        self._cache.move_to_end(file_uri)
+        if len(self._cache) > self.RESULT_CACHE_SIZE:
+            self._cache.popitem(last=False)
 
-        logger.debug(f"Returning {len(document_symbols)} document symbols")
+        logger.debug("Returning %d document symbols", len(document_symbols))
 
         return document_symbols
 
+    def invalidate(self, file_uri: str) -> None:
+        """
+        Drop the cached outline of a file (e.g., when it is closed).
+
+        Args:
+            file_uri (str): File URI
+        """
+        self._cache.pop(file_uri, None)
+
     def _create_document_symbols(
         self, symbols: List[Symbol]
     ) -> List[DocumentSymbol]:
@@ -69,11 +107,15 @@ class DocumentSymbolHandler:
         Returns:
             List[DocumentSymbol]: Hierarchical document symbols
         """
-        # Group symbols by kind
-        classes = [s for s in symbols if s.kind == "class"]
-        functions = [s for s in symbols if s.kind == "function"]
-        methods = [s for s in symbols if s.kind == "method"]
-        variables = [s for s in symbols if s.kind == "variable"]
+        # Group symbols by kind, and methods/variables by scope, in one pass
+        by_kind: Dict[str, List[Symbol]] = defaultdict(list)
+        by_scope: Dict[Tuple[str, str], List[Symbol]] = defaultdict(list)
+        for symbol in symbols:
+            by_kind[symbol.kind].append(symbol)
+            by_scope[symbol.kind, symbol.scope].append(symbol)
+
+        classes = by_kind["class"]
+        class_names = {c.name for c in classes}
 
         # Build hierarchy: classes contain methods
         document_symbols = []
@@ -81,7 +123,7 @@ class DocumentSymbolHandler:
         # Add classes with their methods
         for cls in classes:
             # Find methods belonging to this class
-            class_methods = [m for m in methods if m.scope == cls.name]
+            class_methods = by_scope.get(("method", cls.name), [])
 
             # Create class document symbol
             class_symbol = self._create_document_symbol(
@@ -95,37 +137,43 @@ class DocumentSymbolHandler:
             )
             document_symbols.append(class_symbol)
 
-        # Add standalone functions (not nested, not in class)
-        for func in functions:
+        # One node per function, each with its children list allocated up
+        # front; same-named functions share a list, as in a single scope
+        children_by_name: Dict[str, List[DocumentSymbol]] = {}
+        function_nodes = []
+        for func in by_kind["function"]:
+            func_symbol = self._create_document_symbol(
+                func.name,
+                "function",
+                func.detail,
+                func.line,
+                func.column,
+                func.name,
+                children=children_by_name.setdefault(func.name, []),
+            )
+            function_nodes.append((func, func_symbol))
+
+        # Attach nested functions to their parent function's children
+        for func, func_symbol in function_nodes:
+            siblings = children_by_name.get(func.scope)
+            if siblings is not None:
+                siblings.append(func_symbol)
             # Function is standalone if it's not in a class scope
-            is_in_class = any(c.name == func.scope for c in classes)
-
-            if not is_in_class:
-                # Create function document symbol
-                func_symbol = self._create_document_symbol(
-                    func.name,
-                    "function",
-                    func.detail,
-                    func.line,
-                    func.column,
-                    func.name,
-                    children=self._find_nested_functions(functions, func.name),
-                )
+            if func.scope not in class_names:
                 document_symbols.append(func_symbol)
 
         # Add top-level variables
-        for var in variables:
-            if var.scope == "global":
-                var_symbol = self._create_document_symbol(
-                    var.name,
-                    "variable",
-                    var.detail or "variable",
-                    var.line,
-                    var.column,
-                    var.name,
-                    children=[],
-                )
-                document_symbols.append(var_symbol)
+        for var in by_scope.get(("variable", "global"), []):
+            var_symbol = self._create_document_symbol(
+                var.name,
+                "variable",
+                var.detail or "variable",
+                var.line,
+                var.column,
+                var.name,
+                children=[],
+            )
+            document_symbols.append(var_symbol)
 
         return document_symbols
 
@@ -175,7 +223,7 @@ class DocumentSymbolHandler:
             detail=detail,
             range=range_obj,
             selection_range=selection_range_obj,
-            children=children or [],
+            children=children if children is not None else [],
         )
 
     def _methods_to_document_symbols(
@@ -206,48 +254,9 @@ class DocumentSymbolHandler:
 
         return doc_symbols
 
-    def _find_nested_functions(
-        self, functions: List[Symbol], parent_name: str
-    ) -> List[DocumentSymbol]:
-        """
-        Find nested functions for a parent function.
-
-        Args:
-            functions (List[Symbol]): List of function symbols
-            parent_name (str): Parent function name
-
-        Returns:
-            List[DocumentSymbol]: Nested function symbols
-        """
-        # Nested functions have parent function as scope
-        nested = [f for f in functions if f.scope == parent_name]
-
-        nested_symbols = []
-
-        for func in nested:
-            func_symbol = self._create_document_symbol(
-                func.name,
-                "function",
-                func.detail,
-                func.line,
-                func.column,
-                func.name,
-                children=self._find_nested_functions(functions, func.name),
-            )
-            nested_symbols.append(func_symbol)
-
-        return nested_symbols
-
     def _map_symbol_kind_to_symbol_kind(self, symbol_kind: str) -> SymbolKind:
         """Map symbol kind to LSP SymbolKind."""
-        kind_map = {
-            "function": SymbolKind.Function,
-            "method": SymbolKind.Method,
-            "class": SymbolKind.Class,
-            "variable": SymbolKind.Variable,
-            "property": SymbolKind.Property,
-        }
-        return kind_map.get(symbol_kind, SymbolKind.Variable)
+        return _SYMBOL_KINDS.get(symbol_kind, SymbolKind.Variable)
 
 
 # Global document symbol handler instance
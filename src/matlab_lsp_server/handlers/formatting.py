@@ -5,7 +5,9 @@ This module implements textDocument/formatting to provide
 code formatting functionality for MATLAB files.
 """
 
-from typing import List, Optional
+import re
+from collections import OrderedDict
+from typing import List, Optional, Tuple
 
 from lsprotocol.types import FormattingOptions, Position, Range, TextEdit
 from pygls.lsp.server import LanguageServer
@@ -18,6 +20,15 @@ logger = get_logger(__name__)
 class FormattingHandler:
     """Handler for code formatting in MATLAB LSP server."""
 
+    # Maximum number of formatting results kept in memory
+    RESULT_CACHE_SIZE = 16
+
+    # Leading keyword of a line: group 1 is set for "end", which closes
+    # a block (reduce indent); the others open one (indent next lines)
+    KEYWORD_PATTERN = re.compile(
+        r"(?:(end)|classdef|function|for|while|if|else|elseif|try|catch)\b"
+    )
+
     def __init__(self):
         """Initialize formatting handler."""
         self._config = {
@@ -25,6 +36,10 @@ class FormattingHandler:
             "max_line_length": 80,  # Default line length
             "preserve_newlines": True,  # Preserve newlines
         }
+        # LRU of edits keyed by (file_uri, content, tab_size, insert_spaces)
+        self._result_cache: OrderedDict[
+            Tuple[str, str, int, bool], List[TextEdit]
+        ] = OrderedDict()
         logger.debug("FormattingHandler initialized")
 
     def provide_formatting(
@@ -47,14 +62,23 @@ class FormattingHandler:
             List[TextEdit]: List of text edits for formatting
         """
         logger.debug(
-            f"Providing formatting for {file_uri}: "
-            f"{len(content)} characters"
+            "Providing formatting for %s: %d characters",
+            file_uri,
+            len(content),
         )
 
         # Parse options
         tab_size = options.tab_size if options else self._config["indent_size"]
         insert_spaces = options.insert_spaces if options else True
 
+        # Reuse the edits computed for identical content and options
+        cache_key = (file_uri, content, tab_size, insert_spaces)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            logger.debug("Using cached formatting for %s", file_uri)
+            return list(cached)
+
         # Generate formatted content
         formatted_content = self._format_matlab_code(
             content,
@@ -67,12 +91,13 @@ class FormattingHandler:
 
         # If content is different, create edit
         if formatted_content != content:
-            lines = content.split("\n")
+            # Locate the end of the document without splitting it
+            last_newline = content.rfind("\n")
             range_obj = Range(
                 start=Position(line=0, character=0),
                 end=Position(
-                    line=len(lines) - 1,
-                    character=len(lines[-1]) if lines else 0,
+                    line=content.count("\n"),
+                    character=len(content) - last_newline - 1,
                 ),
             )
             edit = TextEdit(
@@ -81,11 +106,14 @@ class FormattingHandler:
             )
             edits.append(edit)
 
-            logger.debug(f"Generated {len(edits)} formatting edits")
+            logger.debug("Generated %d formatting edits", len(edits))
         else:
             logger.debug("Content already formatted, no edits needed")
 
-        return edits
+        self._result_cache[cache_key] = edits
+        if len(self._result_cache) > self.RESULT_CACHE_SIZE:
+            self._result_cache.popitem(last=False)
+        return list(edits)
 
     def _format_matlab_code(
         self,
@@ -109,6 +137,10 @@ class FormattingHandler:
 
         indent_level = 0
         indent_str = " " * indent_size if insert_spaces else "\t"
+        # Indent prefix by level, extended as deeper levels are reached
+        indents = [""]
+        match_keyword = self.KEYWORD_PATTERN.match
+        append = formatted_lines.append
 
         for line in lines:
             # Check line type
@@ -116,37 +148,25 @@ class FormattingHandler:
 
             # Skip empty lines
             if not stripped_line:
-                formatted_lines.append(line)  # Preserve empty lines
+                append(line)  # Preserve empty lines
                 continue
 
+            # One match classifies the line
+            keyword = match_keyword(stripped_line)
+            is_end = keyword is not None and keyword.lastindex == 1
+
             # Handle end statements (reduce indent)
-            if stripped_line.startswith("end"):
+            if is_end:
                 indent_level = max(0, indent_level - 1)
 
+            # Apply current indent
+            while len(indents) <= indent_level:
+                indents.append(indents[-1] + indent_str)
+            append(indents[indent_level] + stripped_line)
+
             # Handle classdef/function/for/while/if (increase indent)
-            elif any(
-                stripped_line.startswith(keyword)
-                for keyword in [
-                    "classdef",
-                    "function",
-                    "for",
-                    "while",
-                    "if",
-                    "else",
-                    "elseif",
-                    "try",
-                    "catch",
-                ]
-            ):
-                # Apply current indent
-                formatted_line = indent_str * indent_level + stripped_line
-                formatted_lines.append(formatted_line)
+            if keyword is not None and not is_end:
                 indent_level += 1
-                continue
-
-            # Apply current indent
-            formatted_line = indent_str * indent_level + stripped_line
-            formatted_lines.append(formatted_line)
 
         # Join lines
         formatted_content = "\n".join(formatted_lines)
@@ -165,7 +185,8 @@ class FormattingHandler:
             config (dict): Configuration options
         """
         self._config.update(config)
-        logger.debug(f"Formatting config updated: {config}")
+        self._result_cache.clear()
+        logger.debug("Formatting config updated: %s", config)
 
 
 # Global formatting handler instance
@@ -10,15 +10,40 @@ from typing import List, Optional
 from lsprotocol.types import Hover, Position, Range
 from pygls.lsp.server import LanguageServer
 
+from matlab_lsp_server.parser.models import MATLAB_KEYWORDS
 from matlab_lsp_server.utils.logging import get_logger
 from matlab_lsp_server.utils.symbol_table import Symbol, SymbolTable, get_symbol_table
 
 logger = get_logger(__name__)
 
+# Reserved words can never name a symbol. Class block names such as
+# "properties" or "methods" are also valid identifiers, so keep those.
+_RESERVED_WORDS = frozenset(MATLAB_KEYWORDS) - {
+    "properties",
+    "methods",
+    "events",
+    "enumeration",
+    "import",
+    "export",
+    "package",
+}
+
+# Hover heading emoji by symbol kind
+_KIND_EMOJIS = {
+    "function": "🔹",
+    "method": "🔹",
+    "class": "🏛",
+    "property": "📋",
+    "variable": "📝",
+}
+
 
 class HoverHandler:
     """Handler for hover information in MATLAB LSP server."""
 
+    # Allowed distance in lines between a symbol and the cursor
+    LINE_TOLERANCE = 5
+
     def __init__(self, symbol_table: Optional[SymbolTable] = None):
         """Initialize hover handler.
 
@@ -50,31 +75,41 @@ class HoverHandler:
             Optional[Hover]: Hover information if symbol found
         """
         logger.debug(
-            f"Providing hover for {file_uri}:"
-            f"({position.line}:{position.character}) "
-            f"word: '{word}'"
+            "Providing hover for %s:(%d:%d) word: '%s'",
+            file_uri,
+            position.line,
+            position.character,
+            word,
         )
 
         if not word or len(word) == 0:
             return None
 
-        # Search for symbol in current file
-        file_symbols = self._symbol_table.get_symbols_by_uri(file_uri)
+        # Keywords, numbers and operators have no symbol to look up
+        if word in _RESERVED_WORDS or not word[0].isalpha():
+            return None
+
+        # Search for symbol near the cursor in current file
+        cursor_line = position.line + 1  # Convert from 0-based to 1-based
+        file_symbols = self._symbol_table.get_symbols_in_line_range(
+            file_uri,
+            cursor_line - self.LINE_TOLERANCE,
+            cursor_line + self.LINE_TOLERANCE,
+        )
         symbol = self._find_symbol_at_position(file_symbols, position, word)
 
         if not symbol:
             # Also search in all files for built-in functions
-            all_symbols = self._symbol_table.get_all_symbols()
-            symbol = self._find_symbol_by_name(all_symbols, word)
+            symbol = self._find_symbol_by_name(word)
 
         if not symbol:
-            logger.debug(f"No symbol found for '{word}'")
+            logger.debug("No symbol found for '%s'", word)
             return None
 
         # Create hover content
         hover_content = self._create_hover_content(symbol)
 
-        logger.debug(f"Hover information for '{word}': {symbol.kind}")
+        logger.debug("Hover information for '%s': %s", word, symbol.kind)
 
         # Create range
         range_obj = Range(
@@ -110,36 +145,32 @@ class HoverHandler:
         # Find symbol matching the word at the position
         # Simple heuristic: symbol on the same line or close to cursor
         cursor_line = position.line + 1  # Convert from 0-based to 1-based
+        word_lower = word.lower()
 
         for symbol in symbols:
             # Check if symbol name matches the word
-            if symbol.name.lower() != word.lower():
+            if symbol.name_lower != word_lower:
                 continue
 
             # Check if symbol is close to cursor position
             # Allow some tolerance for multi-line functions
-            if abs(symbol.line - cursor_line) <= 5:
+            if abs(symbol.line - cursor_line) <= self.LINE_TOLERANCE:
                 return symbol
 
         return None
 
-    def _find_symbol_by_name(
-        self, symbols: List[Symbol], name: str
-    ) -> Optional[Symbol]:
+    def _find_symbol_by_name(self, name: str) -> Optional[Symbol]:
         """
-        Find symbol by name (case-insensitive).
+        Find symbol by name (case-insensitive) in all files.
 
         Args:
-            symbols (list): List of symbols
             name (str): Symbol name
 
         Returns:
             Optional[Symbol]: First matching symbol
         """
-        for symbol in symbols:
-            if symbol.name.lower() == name.lower():
-                return symbol
-        return None
+        symbols = self._symbol_table.get_symbols_by_lower_name(name.lower())
+        return symbols[0] if symbols else None
 
     def _create_hover_content(self, symbol: Symbol) -> str:
         """
@@ -151,36 +182,26 @@ class HoverHandler:
         Returns:
             str: Hover content in Markdown format
         """
-        # Build markdown content
-        lines = []
-
-        # Symbol kind and name
-        kind_emoji = self._get_kind_emoji(symbol.kind)
-        lines.append(f"**{kind_emoji} {symbol.kind}: {symbol.name}**")
-
         # Additional details
-        if symbol.detail and symbol.detail != symbol.kind:
-            lines.append(f"\n{symbol.detail}")
+        detail = (
+            f"\n\n{symbol.detail}"
+            if symbol.detail and symbol.detail != symbol.kind
+            else ""
+        )
 
         # Documentation
-        if symbol.documentation:
-            lines.append(f"\n---\n\n{symbol.documentation}")
-
-        # Join lines with newlines
-        content = "\n".join(lines)
-
-        return content
-
-    def _get_kind_emoji(self, kind: str) -> str:
-        """Get emoji for symbol kind."""
-        emoji_map = {
-            "function": "🔹",
-            "method": "🔹",
-            "class": "🏛",
-            "property": "📋",
-            "variable": "📝",
-        }
-        return emoji_map.get(kind, "📌")
+        documentation = (
+            f"\n\n---\n\n{symbol.documentation}"
+            if symbol.documentation
+            else ""
+        )
+
+        # Symbol kind and name, then the optional parts
+        kind_emoji = _KIND_EMOJIS.get(symbol.kind, "📌")
+        return (
+            f"**{kind_emoji} {symbol.kind}: {symbol.name}**"
+            f"{detail}{documentation}"
+        )
 
 
 # Global hover handler instance
@@ -19,6 +19,9 @@ logger = get_logger(__name__)
 class ReferencesHandler:
     """Handler for find-all-references in MATLAB LSP server."""
 
+    # Allowed distance in lines between a symbol and the cursor
+    LINE_TOLERANCE = 5
+
     def __init__(self, symbol_table: Optional[SymbolTable] = None):
         """Initialize references handler.
 
@@ -50,17 +53,24 @@ class ReferencesHandler:
             List[Location]: List of reference locations
         """
         logger.debug(
-            f"Providing references for {file_uri}:"
-            f"({position.line}:{position.character}) "
-            f"include_declaration: {include_declaration}"
+            "Providing references for %s:(%d:%d) include_declaration: %s",
+            file_uri,
+            position.line,
+            position.character,
+            include_declaration,
         )
 
         # Get word at position (simplified - assume we already have it)
         # In practice, need to extract word from document
         # For now, we'll search all symbols
 
-        # Search for symbols in current file
-        file_symbols = self._symbol_table.get_symbols_by_uri(file_uri)
+        # Search for symbols near the cursor in current file
+        cursor_line = position.line + 1  # Convert from 0-based to 1-based
+        file_symbols = self._symbol_table.get_symbols_in_line_range(
+            file_uri,
+            cursor_line - self.LINE_TOLERANCE,
+            cursor_line + self.LINE_TOLERANCE,
+        )
 
         # Search for symbol at position
         # For references, we need to know which symbol to find
@@ -72,13 +82,12 @@ class ReferencesHandler:
             return []
 
         # Search for all symbols with matching name
-        all_symbols = self._symbol_table.get_all_symbols()
-        matching_symbols = [
-            s for s in all_symbols if s.name.lower() == word.lower()
-        ]
+        matching_symbols = self._symbol_table.get_symbols_by_lower_name(
+            word.lower()
+        )
 
         logger.debug(
-            f"Found {len(matching_symbols)} symbols matching '{word}'"
+            "Found %d symbols matching '%s'", len(matching_symbols), word
         )
 
         # Create locations for all matches
@@ -93,7 +102,7 @@ class ReferencesHandler:
             if len(locations) > 0:
                 locations = locations[1:]
 
-        logger.debug(f"Returning {len(locations)} reference locations")
+        logger.debug("Returning %d reference locations", len(locations))
 
         return locations
 
@@ -115,7 +124,7 @@ class ReferencesHandler:
 
         for symbol in symbols:
             # Check if symbol is close to cursor position
-            if abs(symbol.line - cursor_line) <= 5:
+            if abs(symbol.line - cursor_line) <= self.LINE_TOLERANCE:
                 return symbol.name
 
         return None
@@ -21,6 +21,15 @@ from matlab_lsp_server.utils.symbol_table import Symbol, SymbolTable, get_symbol
 
 logger = get_logger(__name__)
 
+# LSP SymbolKind by symbol table kind
+_SYMBOL_KINDS = {
+    "function": SymbolKind.Function,
+    "method": SymbolKind.Method,
+    "class": SymbolKind.Class,
+    "variable": SymbolKind.Variable,
+    "property": SymbolKind.Property,
+}
+
 
 class WorkspaceSymbolHandler:
     """Handler for workspace symbols in MATLAB LSP server."""
@@ -49,7 +58,7 @@ class WorkspaceSymbolHandler:
         Returns:
             List[SymbolInformation]: List of matching symbols
         """
-        logger.debug(f"Providing workspace symbols: " f"query='{query}'")
+        logger.debug("Providing workspace symbols: query='%s'", query)
 
         # Get all symbols
         all_symbols = self._symbol_table.get_all_symbols()
@@ -67,7 +76,7 @@ class WorkspaceSymbolHandler:
             self._create_symbol_information(s) for s in matching_symbols
         ]
 
-        logger.debug(f"Returning {len(symbol_infos)} workspace symbols")
+        logger.debug("Returning %d workspace symbols", len(symbol_infos))
 
         return symbol_infos
 
@@ -87,7 +96,7 @@ class WorkspaceSymbolHandler:
         query_lower = query.lower()
 
         # Fuzzy matching: check if query is in symbol name
-        matching = [s for s in symbols if query_lower in s.name.lower()]
+        matching = [s for s in symbols if query_lower in s.name_lower]
 
         return matching
 
@@ -135,14 +144,7 @@ class WorkspaceSymbolHandler:
 
     def _map_symbol_kind_to_symbol_kind(self, symbol_kind: str) -> SymbolKind:
         """Map symbol kind to LSP SymbolKind."""
-        kind_map = {
-            "function": SymbolKind.Function,
-            "method": SymbolKind.Method,
-            "class": SymbolKind.Class,
-            "variable": SymbolKind.Variable,
-            "property": SymbolKind.Property,
-        }
-        return kind_map.get(symbol_kind, SymbolKind.Variable)
+        return _SYMBOL_KINDS.get(symbol_kind, SymbolKind.Variable)
 
     def filter_by_kind(
         self, symbols: List[Symbol], kinds: List[str]
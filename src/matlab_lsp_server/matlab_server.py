@@ -3,6 +3,9 @@ Custom Language Server for MATLAB with configuration via
 initialized notification.
 """
 
+import asyncio
+from typing import Optional
+
 from lsprotocol.types import (
     InitializedParams,
     InitializeParams,
@@ -11,9 +14,9 @@ from lsprotocol.types import (
 from pygls.lsp.server import LanguageServer
 
 from matlab_lsp_server.analyzer.mlint_analyzer import MlintAnalyzer
-from matlab_lsp_server.features.feature_manager import FeatureManager
 from matlab_lsp_server.parser.matlab_parser import MatlabParser
 from matlab_lsp_server.protocol import document_sync
+from matlab_lsp_server.protocol.lifecycle import get_feature_manager
 from matlab_lsp_server.utils.document_store import DocumentStore
 from matlab_lsp_server.utils.logging import get_logger
 from matlab_lsp_server.utils.symbol_table import get_symbol_table
@@ -35,6 +38,9 @@ class MatLSServer(LanguageServer):
         # Store initialization params for later use
         self._init_params = None
 
+        # Background task that locates mlint after initialization
+        self._warmup_task: Optional[asyncio.Task] = None
+
         # Register handlers
         self._register_handlers()
 
@@ -59,11 +65,8 @@ class MatLSServer(LanguageServer):
             self._init_params = params
 
             # Return default result (will be overwritten later if needed)
-            from matlab_lsp_server.features.feature_manager import FeatureManager
-
-            fm = FeatureManager()
             return InitializeResult(
-                capabilities=fm.get_capabilities(),
+                capabilities=get_feature_manager().get_capabilities(),
                 server_info={
                     "name": "matlab-lsp",
                     "version": "0.2.9"
@@ -113,24 +116,8 @@ class MatLSServer(LanguageServer):
 
             logger.info(f"Extracted matlab_path: {matlab_path}")
 
-            # Initialize analyzer
-            self._mlint_analyzer = MlintAnalyzer(matlab_path=matlab_path)
-            logger.info(f"MlintAnalyzer created with path: {matlab_path}")
-
-            if self._mlint_analyzer.is_available():
-                logger.info(
-                    "MlintAnalyzer is available at: "
-                    f"{self._mlint_analyzer.mlint_path}"
-                )
-            else:
-                logger.error(
-                    "MlintAnalyzer is NOT available! "
-                    f"matlab_path={matlab_path}, "
-                    f"mlint_path={self._mlint_analyzer.mlint_path}"
-                )
-
-            # Initialize feature manager
-            self._feature_manager = FeatureManager()
+            # Reuse the feature manager built for the initialize response
+            self._feature_manager = get_feature_manager()
 
             # Initialize symbol table and MATLAB parser for v0.2.6
             self._symbol_table = get_symbol_table()
@@ -138,8 +125,9 @@ class MatLSServer(LanguageServer):
             logger.info("SymbolTable and MatlabParser initialized")
 
             # Register document sync handlers
+            # (the analyzer is attached once the warmup task finishes)
             document_sync.register_document_sync_handlers(
-                self, self._document_store, self._mlint_analyzer,
+                self, self._document_store, None,
                 self._symbol_table, self._matlab_parser
             )
             logger.info("Document sync handlers registered")
@@ -155,4 +143,45 @@ class MatLSServer(LanguageServer):
             logger.info("Method handlers registered (completion, hover, documentSymbol, etc.)")
             logger.info("[INFO] All handlers now registered correctly!")
 
+            # Locate mlint in the background so the handshake is not
+            # blocked by filesystem discovery
+            self._warmup_task = asyncio.create_task(
+                self._warmup(matlab_path)
+            )
+
             logger.info("=== SERVER FULLY CONFIGURED ===")
+
+    async def _warmup(self, matlab_path: Optional[str]) -> None:
+        """Create the mlint analyzer off the event loop.
+
+        mlint discovery may walk MATLAB installation directories, so it
+        runs in the default executor. Document sync handlers wait for
+        the analyzer before publishing diagnostics.
+
+        Args:
+            matlab_path: MATLAB installation path from client options
+        """
+        loop = asyncio.get_running_loop()
+        analyzer = None
+        try:
+            analyzer = await loop.run_in_executor(
+                None, MlintAnalyzer, matlab_path
+            )
+            logger.info(f"MlintAnalyzer created with path: {matlab_path}")
+
+            if analyzer.is_available():
+                logger.info(
+                    "MlintAnalyzer is available at: "
+                    f"{analyzer.mlint_path}"
+                )
+            else:
+                logger.error(
+                    "MlintAnalyzer is NOT available! "
+                    f"matlab_path={matlab_path}, "
+                    f"mlint_path={analyzer.mlint_path}"
+                )
+        except Exception as e:
+            logger.error(f"Error creating MlintAnalyzer: {e}")
+        finally:
+            self._mlint_analyzer = analyzer
+            document_sync.update_analyzer(analyzer)
@@ -7,6 +7,7 @@ This module implements LSP document synchronization methods:
 - textDocument/didChange
 """
 
+import asyncio
 from pathlib import Path
 from typing import Optional
 from urllib.parse import unquote, urlparse
@@ -19,7 +20,10 @@ from lsprotocol.types import (
 from pygls.lsp.server import LanguageServer
 
 from matlab_lsp_server.analyzer.mlint_analyzer import MlintAnalyzer
-from matlab_lsp_server.handlers.diagnostics import publish_diagnostics
+from matlab_lsp_server.handlers.diagnostics import get_diagnostics_scheduler
+from matlab_lsp_server.handlers.document_symbol import (
+    get_document_symbol_handler,
+)
 from matlab_lsp_server.parser.matlab_parser import MatlabParser
 from matlab_lsp_server.utils.logging import get_logger
 from matlab_lsp_server.utils.document_store import DocumentStore
@@ -33,11 +37,15 @@ document_store = None
 
 mlint_analyzer = None
 
+# Set once mlint_analyzer has been resolved (it may be created in the
+# background after registration)
+_analyzer_ready: Optional[asyncio.Event] = None
+
 
 def register_document_sync_handlers(
     server: LanguageServer,
     doc_store: DocumentStore,
-    analyzer: MlintAnalyzer,
+    analyzer: Optional[MlintAnalyzer],
     symbol_table: Optional[SymbolTable] = None,
     matlab_parser: Optional[MatlabParser] = None,
 ) -> None:
@@ -47,14 +55,18 @@ def register_document_sync_handlers(
     Args:
         server (LanguageServer): LSP server instance
         doc_store (DocumentStore): Document store instance
-        analyzer (MlintAnalyzer): Analyzer instance (e.g., MlintAnalyzer)
+        analyzer (Optional[MlintAnalyzer]): Analyzer instance, or None if
+            it will be provided later via update_analyzer()
         symbol_table (Optional[SymbolTable]): Symbol table for document symbols
         matlab_parser (Optional[MatlabParser]): MATLAB parser instance
     """
-    global document_store, mlint_analyzer
+    global document_store, mlint_analyzer, _analyzer_ready
 
     document_store = doc_store
     mlint_analyzer = analyzer
+    _analyzer_ready = asyncio.Event()
+    if analyzer is not None:
+        _analyzer_ready.set()
 
     logger.debug("Registering document sync handlers")
 
@@ -85,9 +97,10 @@ def register_document_sync_handlers(
             except Exception as e:
                 logger.error(f"Error parsing file {file_path}: {e}")
 
-        # Trigger analysis (only if analyzer is available)
-        if mlint_analyzer.is_available():
-            publish_diagnostics(server, uri, mlint_analyzer, file_path)
+        # Trigger analysis right away (only if analyzer is available)
+        await _trigger_analysis_with_debounce(
+            server, uri, file_path, debounce_ms=0
+        )
 
     @server.feature("textDocument/didClose")
     async def did_close(params: DidCloseTextDocumentParams) -> None:
@@ -102,7 +115,9 @@ def register_document_sync_handlers(
 
         logger.debug(f"Document closed: {file_path}")
 
-        # Remove from document store
+        # Drop pending analysis, cached outline and stored document
+        get_diagnostics_scheduler().cancel(uri)
+        get_document_symbol_handler().invalidate(uri)
         document_store.remove_document(uri)
 
         # Added for v0.2.6: Remove symbols from table
@@ -147,7 +162,7 @@ def register_document_sync_handlers(
         document_store.update_document_content(uri, new_content)
 
         # Trigger analysis with debouncing
-        _trigger_analysis_with_debounce(server, uri, file_path)
+        await _trigger_analysis_with_debounce(server, uri, file_path)
 
 
 def _uri_to_path(uri: str) -> str:
@@ -177,54 +192,63 @@ def _uri_to_path(uri: str) -> str:
     return uri
 
 
-def _trigger_analysis_with_debounce(
+async def _trigger_analysis_with_debounce(
     server: LanguageServer,
     uri: str,
     file_path: str,
-    debounce_ms: int = 500,
+    debounce_ms: int = 200,
 ) -> None:
     """
     Trigger analysis with debouncing to avoid
     excessive analysis on rapid changes.
 
+    Changes to the same document within the debounce window are
+    coalesced into a single analyzer run; other documents are not
+    affected.
+
     Args:
         server (LanguageServer): LSP server instance
         uri (str): Document URI
         file_path (str): Local file path
         debounce_ms (int): Debounce time in milliseconds
     """
-    # Simple debounce implementation
-    # In production, use a proper debounce library
-    import asyncio
-
-    async def analyze_task():
-        logger.debug(f"Triggering analysis for: {file_path}")
-        if mlint_analyzer.is_available():
-            publish_diagnostics(server, uri, mlint_analyzer, file_path)
-
-    # Cancel any existing task and schedule new one
-    if hasattr(_trigger_analysis_with_debounce, "_task"):
-        try:
-            _trigger_analysis_with_debounce._task.cancel()
-        except Exception:
-            pass
-
-    async def debounced_analyze():
-        await asyncio.sleep(debounce_ms / 1000)
-        await analyze_task()
-
-    _trigger_analysis_with_debounce._task = asyncio.create_task(  # type: ignore[attr-defined]
-        debounced_analyze()
+    if not await _wait_for_analyzer():
+        return
+
+    get_diagnostics_scheduler().schedule(
+        server, uri, mlint_analyzer, file_path, delay=debounce_ms / 1000
     )
 
 
-def update_analyzer(analyzer: MlintAnalyzer) -> None:
+async def _wait_for_analyzer() -> bool:
+    """
+    Wait until the analyzer has been resolved.
+
+    Returns:
+        bool: True if an available analyzer is set, False otherwise
+    """
+    if _analyzer_ready is not None:
+        await _analyzer_ready.wait()
+    return mlint_analyzer is not None and mlint_analyzer.is_available()
+
+
+def update_analyzer(analyzer: Optional[MlintAnalyzer]) -> None:
     """
     Update the analyzer used by document sync handlers.
 
+    Also releases handlers waiting for the analyzer to be resolved.
+
     Args:
-        analyzer (MlintAnalyzer): New analyzer instance
+        analyzer (Optional[MlintAnalyzer]): New analyzer instance, or None
+            if no analyzer could be created
     """
     global mlint_analyzer
     mlint_analyzer = analyzer
-    logger.info(f"Document sync analyzer updated to: {analyzer.get_name()}")
+    if _analyzer_ready is not None:
+        _analyzer_ready.set()
+    if analyzer is not None:
+        logger.info(
+            f"Document sync analyzer updated to: {analyzer.get_name()}"
+        )
+    else:
+        logger.warning("Document sync analyzer unavailable")
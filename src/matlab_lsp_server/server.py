@@ -9,10 +9,6 @@ import argparse
 import logging
 import sys
 
-from pathlib import Path
-
-from matlab_lsp_server.matlab_server import MatLSServer
-from matlab_lsp_server.utils.config import ensure_config_exists
 from matlab_lsp_server.utils.logging import get_logger, setup_logging
 
 __version__ = "0.2.2"
@@ -98,26 +94,21 @@ def main() -> int:
 
     # Create default config if not exists
     if not args.no_init_config:
-        config_path = Path.cwd() / ".matlab-lsprc.json"
-        config_created = ensure_config_exists()
-        if config_created:
-            import json
-            try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = json.load(f)
-                    matlab_path = config.get("matlabPath", "")
-                    if matlab_path:
-                        logger.info(
-                            f"Auto-generated config with MATLAB path: {matlab_path}"
-                        )
-                    else:
-                        logger.info(
-                            "Auto-generated config. MATLAB not found. "
-                            "Basic LSP features will work without MATLAB. "
-                            "To enable full diagnostics, install MATLAB and set matlabPath."
-                        )
-            except Exception:
-                logger.info("Auto-generated config created")
+        from matlab_lsp_server.utils.config import ensure_config_exists
+
+        config = ensure_config_exists()
+        if config is not None:
+            matlab_path = config.get("matlabPath", "")
+            if matlab_path:
+                logger.info(
+                    f"Auto-generated config with MATLAB path: {matlab_path}"
+                )
+            else:
+                logger.info(
+                    "Auto-generated config. MATLAB not found. "
+                    "Basic LSP features will work without MATLAB. "
+                    "To enable full diagnostics, install MATLAB and set matlabPath."
+                )
         else:
             logger.info("Using existing config file")
 
@@ -132,6 +123,9 @@ def main() -> int:
 
     # Create server instance
     # (uses custom MatLSServer with overridden lsp_initialize)
+    # Imported here so --help/--version don't load pygls
+    from matlab_lsp_server.matlab_server import MatLSServer
+
     server = MatLSServer("matlab-lsp", __version__)
 
     logger.info("Custom MatLSServer instance created")
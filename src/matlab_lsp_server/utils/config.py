@@ -3,6 +3,7 @@
 import json
 import os
 import platform
+import shutil
 from pathlib import Path
 from typing import Any, Optional
 
@@ -267,6 +268,19 @@ def create_default_config(config_path: Path | None = None) -> Path:
     if config_path.exists():
         return config_path
 
+    _write_default_config(config_path)
+    return config_path
+
+
+def _write_default_config(config_path: Path) -> dict[str, Any]:
+    """Write default configuration file.
+
+    Args:
+        config_path: Path where to create config file
+
+    Returns:
+        Written configuration data
+    """
     # Try to find MATLAB automatically
     matlab_path = _find_matlab_path()
 
@@ -286,14 +300,14 @@ def create_default_config(config_path: Path | None = None) -> Path:
     config_path.write_text(
         json.dumps(default_config, indent=2), encoding="utf-8"
     )
-    return config_path
+    return default_config
 
 
 def _find_matlab_path() -> Optional[str]:
     """Find MATLAB installation directory.
 
     Searches in multiple locations:
-    1. System PATH (recursive search)
+    1. System PATH (and one level below)
     2. Common MATLAB installation paths
 
     Returns:
@@ -314,12 +328,12 @@ def _find_matlab_path() -> Optional[str]:
 
 
 def _find_matlab_in_path() -> Optional[str]:
-    """Recursively search for MATLAB in system PATH.
+    """Search for MATLAB via mlint in system PATH.
 
     Returns:
         Path to MATLAB directory or None
     """
-    mlint_in_path = _find_mlint_in_path_recursive()
+    mlint_in_path = _find_mlint_in_path()
     if mlint_in_path:
         # mlint path: H:/MATLAB/R2023b/bin/win64/mlint.exe
         # Extract MATLAB path: H:/MATLAB/R2023b
@@ -342,32 +356,33 @@ def _find_matlab_in_path() -> Optional[str]:
     return None
 
 
-def _find_mlint_in_path_recursive() -> Optional[str]:
-    """Recursively search for mlint.exe in PATH directories.
+def _find_mlint_in_path() -> Optional[str]:
+    """Search for mlint in PATH directories and one level below them.
+
+    mlint lives in <MATLAB>/bin/<arch>/ while PATH usually holds
+    <MATLAB>/bin, so only immediate subdirectories are checked.
 
     Returns:
-        Path to mlint.exe or None
+        Path to mlint or None
     """
-    mlint_names = ["mlint.exe"] if platform.system() == "Windows" else ["mlint"]
+    mlint_name = "mlint.exe" if platform.system() == "Windows" else "mlint"
+    found = shutil.which(mlint_name)
+    if found:
+        return found
 
     for path_dir in os.environ.get("PATH", "").split(os.pathsep):
-        base_dir = Path(path_dir)
-        if not base_dir.exists():
+        if not path_dir:
+            continue
+        try:
+            with os.scandir(path_dir) as entries:
+                subdirs = [entry.path for entry in entries if entry.is_dir()]
+        except OSError:
             continue
 
-        # Search recursively up to 3 levels deep
-        for root, dirs, files in os.walk(base_dir):
-            # Limit depth to avoid searching entire filesystem
-            depth = root.replace(str(base_dir), "").count(os.sep)
-            if depth > 3:
-                dirs[:] = []  # Don't go deeper
-                continue
-
-            for mlint_name in mlint_names:
-                if mlint_name in files:
-                    full_path = Path(root) / mlint_name
-                    if full_path.exists():
-                        return str(full_path)
+        for subdir in subdirs:
+            full_path = Path(subdir) / mlint_name
+            if full_path.is_file():
+                return str(full_path)
 
     return None
 
@@ -451,7 +466,7 @@ def _find_mlint_in_dir(base_dir: Path) -> Optional[str]:
 
 def ensure_config_exists(
     config_path: Path | None = None, silent: bool = False
-) -> bool:
+) -> dict[str, Any] | None:
     """Ensure configuration file exists, create default if missing.
 
     Args:
@@ -459,13 +474,12 @@ def ensure_config_exists(
         silent: If True, don't log messages
 
     Returns:
-        True if config was created, False if already existed
+        Created configuration data, or None if config already existed
     """
     if config_path is None:
         config_path = Path.cwd() / ".matlab-lsprc.json"
 
     if config_path.exists():
-        return False
+        return None
 
-    create_default_config(config_path)
-    return True
+    return _write_default_config(config_path)
@@ -5,8 +5,9 @@ This module provides code indexing for LSP features like
 completion, go-to-definition, etc.
 """
 
+import bisect
 import hashlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 from .logging import get_logger
@@ -30,6 +31,7 @@ class Symbol:
         documentation (Optional[str]): Symbol documentation (from comments)
         is_global (bool): Whether symbol is globally accessible
         scope (str): Scope name (e.g., parent function name)
+        name_lower (str): Lowercased name for case-insensitive matching
     """
 
     name: str
@@ -41,6 +43,16 @@ class Symbol:
     documentation: Optional[str] = None
     is_global: bool = False
     scope: str = ""
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute lowercased name."""
+        self.name_lower = self.name.lower()
+
+
+def _symbol_line(symbol: Symbol) -> int:
+    """Sort key for the per-file line index."""
+    return symbol.line
 
 
 class SymbolTable:
@@ -63,6 +75,15 @@ class SymbolTable:
         # Use list to allow same name in different scopes
         self._file_hashes: Dict[str, str] = {}
         self._uri_to_symbols: Dict[str, List[Symbol]] = {}
+        # Key: URI, Value: symbols of that file sorted by line
+        self._uri_to_sorted_symbols: Dict[str, List[Symbol]] = {}
+        # Key: lowercased name, Value: symbols with that name in any file
+        self._by_lower_name: Dict[str, List[Symbol]] = {}
+        # Flattened view of all symbols, rebuilt after changes
+        self._all_symbols: Optional[List[Symbol]] = None
+        # Change counter, and its value at each file's last change
+        self._version = 0
+        self._uri_versions: Dict[str, int] = {}
         logger.debug("SymbolTable initialized")
 
     def add_symbol(
@@ -113,8 +134,18 @@ class SymbolTable:
         if uri not in self._uri_to_symbols:
             self._uri_to_symbols[uri] = []
         self._uri_to_symbols[uri].append(symbol)
+        bisect.insort(
+            self._uri_to_sorted_symbols.setdefault(uri, []),
+            symbol,
+            key=_symbol_line,
+        )
 
-        logger.debug(f"Added symbol: {name} ({kind}) at {uri}:{line}")
+        # Add to index by case-insensitive name
+        self._by_lower_name.setdefault(symbol.name_lower, []).append(symbol)
+        self._all_symbols = None
+        self._bump_version(uri)
+
+        logger.debug("Added symbol: %s (%s) at %s:%d", name, kind, uri, line)
 
     def remove_symbols_by_uri(self, uri: str) -> int:
         """
@@ -129,10 +160,25 @@ class SymbolTable:
         if uri not in self._uri_to_symbols:
             return 0
 
-        count = len(self._uri_to_symbols[uri])
-
-        # Remove from URI index
-        del self._uri_to_symbols[uri]
+        removed = self._uri_to_symbols.pop(uri)
+        self._uri_to_sorted_symbols.pop(uri, None)
+        self._all_symbols = None
+        # Back to "never indexed"; versions only grow, so a re-added file
+        # never matches a version cached before its removal
+        self._uri_versions.pop(uri, None)
+        count = len(removed)
+
+        # Remove from case-insensitive name index
+        for name_lower in {symbol.name_lower for symbol in removed}:
+            remaining = [
+                symbol
+                for symbol in self._by_lower_name.get(name_lower, [])
+                if symbol.uri != uri
+            ]
+            if remaining:
+                self._by_lower_name[name_lower] = remaining
+            else:
+                self._by_lower_name.pop(name_lower, None)
 
         # Remove from name index (find and delete all matching)
         keys_to_remove = [
@@ -145,7 +191,7 @@ class SymbolTable:
         if uri in self._file_hashes:
             del self._file_hashes[uri]
 
-        logger.info(f"Removed {count} symbols from {uri}")
+        logger.info("Removed %d symbols from %s", count, uri)
         return count
 
     def get_symbols_by_uri(self, uri: str) -> List[Symbol]:
@@ -160,6 +206,54 @@ class SymbolTable:
         """
         return self._uri_to_symbols.get(uri, []).copy()
 
+    def get_uri_version(self, uri: str) -> int:
+        """
+        Get the version of a file's symbols.
+
+        The version changes whenever symbols of the file are added or
+        removed, so it can be used to validate cached per-file results.
+
+        Args:
+            uri (str): File URI
+
+        Returns:
+            int: Version of the file's symbols (0 if never indexed)
+        """
+        return self._uri_versions.get(uri, 0)
+
+    def get_symbols_in_line_range(
+        self, uri: str, first_line: int, last_line: int
+    ) -> List[Symbol]:
+        """
+        Get symbols of a file defined within a line range.
+
+        Args:
+            uri (str): File URI
+            first_line (int): First line of the range (inclusive)
+            last_line (int): Last line of the range (inclusive)
+
+        Returns:
+            List[Symbol]: Symbols in range, sorted by line
+        """
+        symbols = self._uri_to_sorted_symbols.get(uri)
+        if not symbols:
+            return []
+        lo = bisect.bisect_left(symbols, first_line, key=_symbol_line)
+        hi = bisect.bisect_right(symbols, last_line, lo=lo, key=_symbol_line)
+        return symbols[lo:hi]
+
+    def get_symbols_by_lower_name(self, name: str) -> List[Symbol]:
+        """
+        Get all symbols with the given name, ignoring case.
+
+        Args:
+            name (str): Lowercased symbol name
+
+        Returns:
+            List[Symbol]: Matching symbols in insertion order
+        """
+        return self._by_lower_name.get(name, []).copy()
+
     def search_symbols(
         self, query: str, uri: Optional[str] = None, kind: Optional[str] = None
     ) -> List[Symbol]:
@@ -175,6 +269,7 @@ class SymbolTable:
             List[Symbol]: Matching symbols
         """
         results = []
+        query_lower = query.lower()
 
         # Search in name index (fuzzy match)
         for key, symbols in self._symbols.items():
@@ -188,10 +283,12 @@ class SymbolTable:
                     continue
 
                 # Check if name matches (case-insensitive)
-                if query.lower() in symbol.name.lower():
+                if query_lower in symbol.name_lower:
                     results.append(symbol)
 
-        logger.debug(f"Search for '{query}': found {len(results)} symbols")
+        logger.debug(
+            "Search for '%s': found %d symbols", query, len(results)
+        )
         return results
 
     def get_all_symbols(self) -> List[Symbol]:
@@ -201,10 +298,12 @@ class SymbolTable:
         Returns:
             List[Symbol]: All symbols
         """
-        all_symbols = []
-        for symbols in self._symbols.values():
-            all_symbols.extend(symbols)
-        return all_symbols
+        if self._all_symbols is None:
+            all_symbols = []
+            for symbols in self._symbols.values():
+                all_symbols.extend(symbols)
+            self._all_symbols = all_symbols
+        return self._all_symbols.copy()
 
     def update_from_parse_result(
         self,
@@ -226,7 +325,7 @@ class SymbolTable:
 
         # Skip if content hasn't changed
         if old_hash == new_hash:
-            logger.debug(f"Content unchanged for {uri}, skipping update")
+            logger.debug("Content unchanged for %s, skipping update", uri)
             return
 
         # Remove old symbols
@@ -308,9 +407,10 @@ class SymbolTable:
             )
 
         logger.info(
-            f"Updated symbol table for {uri}: "
-            f"{len(parse_result.functions)} functions, "
-            f"{len(parse_result.classes)} classes"
+            "Updated symbol table for %s: %d functions, %d classes",
+            uri,
+            len(parse_result.functions),
+            len(parse_result.classes),
         )
 
     def clear(self) -> None:
@@ -318,8 +418,12 @@ class SymbolTable:
         count = len(self._uri_to_symbols)
         self._symbols.clear()
         self._uri_to_symbols.clear()
+        self._uri_to_sorted_symbols.clear()
+        self._by_lower_name.clear()
+        self._all_symbols = None
+        self._uri_versions.clear()
         self._file_hashes.clear()
-        logger.info(f"Symbol table cleared: {count} symbols removed")
+        logger.info("Symbol table cleared: %d symbols removed", count)
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -347,6 +451,11 @@ class SymbolTable:
 
         return stats
 
+    def _bump_version(self, uri: str) -> None:
+        """Record a change to the symbols of a file."""
+        self._version += 1
+        self._uri_versions[uri] = self._version
+
     def _get_symbol_key(self, name: str, uri: str, scope: str) -> str:
         """Generate key for symbol index."""
         return f"{uri}:{scope}:{name}"
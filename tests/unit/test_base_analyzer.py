@@ -3,8 +3,13 @@ Unit tests for Base Analyzer.
 """
 
 import pytest
+from lsprotocol.types import DiagnosticSeverity
 
-from src.analyzer.base_analyzer import BaseAnalyzer, DiagnosticResult
+from src.analyzer.base_analyzer import (
+    AnalyzerDiagnostic,
+    BaseAnalyzer,
+    DiagnosticResult,
+)
 
 
 def test_diagnostic_result_creation():
@@ -12,21 +17,21 @@ def test_diagnostic_result_creation():
     result = DiagnosticResult(
         file_uri="file:///test.m",
         diagnostics=[
-            {
-                "line": 1,
-                "column": 1,
-                "message": "Test error",
-                "severity": "error",
-                "code": "E001",
-                "source": "test",
-            }
+            AnalyzerDiagnostic(
+                line=1,
+                column=1,
+                message="Test error",
+                severity=DiagnosticSeverity.Error,
+                code="E001",
+                source="test",
+            )
         ]
     )
 
     assert result.file_uri == "file:///test.m"
     assert len(result.diagnostics) == 1
-    assert result.diagnostics[0]["line"] == 1
-    assert result.diagnostics[0]["message"] == "Test error"
+    assert result.diagnostics[0].line == 1
+    assert result.diagnostics[0].message == "Test error"
 
 
 def test_base_analyzer_is_abstract():
@@ -52,3 +57,17 @@ def test_base_analyzer_module_imports():
     assert BaseAnalyzer is not None
     assert DiagnosticResult is not None
     assert get_logger is not None
+
+
+def test_analyzer_diagnostic_uses_slots():
+    """Test AnalyzerDiagnostic instances carry no per-instance dict."""
+    diagnostic = AnalyzerDiagnostic(
+        line=1,
+        column=1,
+        message="Test",
+        severity=DiagnosticSeverity.Information,
+        code="I",
+        source="test",
+    )
+
+    assert not hasattr(diagnostic, "__dict__")
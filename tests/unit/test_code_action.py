@@ -60,6 +60,50 @@ def test_generate_quick_fixes_missing_semicolon():
     assert len(semicolon_fixes) >= 1
 
 
+def test_generate_quick_fixes_by_message_id():
+    """Test mlint message IDs select fixes without message scans."""
+    handler = CodeActionHandler()
+
+    from lsprotocol.types import Diagnostic
+    diag_range = Range(
+        start=Position(line=0, character=0),
+        end=Position(line=0, character=10),
+    )
+    semicolon = Diagnostic(
+        range=diag_range,
+        message="NOPTS: Terminate statement with semicolon.",
+        code="C 5-10",
+    )
+    other = Diagnostic(
+        range=diag_range,
+        message="AGROW: Variable appears to change size in a loop.",
+    )
+
+    fixes = handler.generate_quick_fixes_from_diagnostic(semicolon)
+
+    assert [f["title"] for f in fixes] == ["Add semicolon"]
+    assert handler.generate_quick_fixes_from_diagnostic(other) == []
+
+
+def test_generate_quick_fixes_unknown_id_falls_back():
+    """Test unknown message IDs still get fixes from message patterns."""
+    handler = CodeActionHandler()
+
+    from lsprotocol.types import Diagnostic
+    diagnostic = Diagnostic(
+        range=Range(
+            start=Position(line=0, character=0),
+            end=Position(line=0, character=10),
+        ),
+        message="NOSEMI: Missing semicolon.",
+        code="NOSEMI",
+    )
+
+    fixes = handler.generate_quick_fixes_from_diagnostic(diagnostic)
+
+    assert [f["title"] for f in fixes] == ["Add semicolon"]
+
+
 def test_provide_code_actions_empty():
     """Test providing code actions with empty diagnostics."""
     handler = CodeActionHandler()
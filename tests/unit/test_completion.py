@@ -64,6 +64,25 @@ def test_rank_candidates():
     pass
 
 
+def test_rank_candidates_orders_by_match():
+    """Test exact, then prefix, then partial matches, each by label."""
+    from lsprotocol.types import CompletionItem
+
+    handler = CompletionHandler(symbol_table=SymbolTable())
+    candidates = [
+        CompletionItem(label=label)
+        for label in ("xsin", "sinh", "sin", "asin", "sina")
+    ]
+
+    ranked = handler._rank_candidates(candidates, "sin")
+
+    assert [c.label for c in ranked] == ["sin", "sina", "sinh", "asin", "xsin"]
+    assert [c.sort_text for c in ranked][:2] == ["0:sin", "1:sina"]
+
+    top = handler._rank_candidates(candidates, "sin", limit=3)
+    assert [c.label for c in top] == ["sin", "sina", "sinh"]
+
+
 def test_map_symbol_kind_to_completion_kind():
     """Test mapping symbol kinds to completion item kinds."""
     table = SymbolTable()
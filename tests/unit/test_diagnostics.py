@@ -5,7 +5,7 @@ Unit tests for Diagnostics Handler.
 from lsprotocol.types import Diagnostic, DiagnosticSeverity
 from pygls.server import LanguageServer
 
-from src.analyzer.base_analyzer import DiagnosticResult
+from src.analyzer.base_analyzer import AnalyzerDiagnostic, DiagnosticResult
 from src.handlers.diagnostics import mlint_result_to_lsp_diagnostics, publish_diagnostics
 
 
@@ -15,30 +15,30 @@ def test_mlint_result_to_lsp_diagnostics():
     result = DiagnosticResult(
         file_uri="file:///test.m",
         diagnostics=[
-            {
-                "line": 10,
-                "column": 1,
-                "message": "Variable 'x' not used.",
-                "severity": "error",
-                "code": "E001",
-                "source": "mlint",
-            },
-            {
-                "line": 20,
-                "column": 5,
-                "message": "Missing semicolon.",
-                "severity": "warning",
-                "code": "C001",
-                "source": "mlint",
-            },
-            {
-                "line": 30,
-                "column": 1,
-                "message": "Use of 'eval' is discouraged.",
-                "severity": "info",
-                "code": "I001",
-                "source": "mlint",
-            },
+            AnalyzerDiagnostic(
+                line=10,
+                column=1,
+                message="Variable 'x' not used.",
+                severity=DiagnosticSeverity.Error,
+                code="E001",
+                source="mlint",
+            ),
+            AnalyzerDiagnostic(
+                line=20,
+                column=5,
+                message="Missing semicolon.",
+                severity=DiagnosticSeverity.Warning,
+                code="C001",
+                source="mlint",
+            ),
+            AnalyzerDiagnostic(
+                line=30,
+                column=1,
+                message="Use of 'eval' is discouraged.",
+                severity=DiagnosticSeverity.Information,
+                code="I001",
+                source="mlint",
+            ),
         ]
     )
 
@@ -70,6 +70,30 @@ def test_mlint_result_to_lsp_diagnostics():
     assert lsp_diagnostics[2].code == "I001"
 
 
+def test_mlint_result_to_lsp_diagnostics_reused():
+    """Test a result is converted to LSP diagnostics only once."""
+    result = DiagnosticResult(
+        file_uri="file:///test.m",
+        diagnostics=[
+            AnalyzerDiagnostic(
+                line=1,
+                column=0,
+                message="Missing semicolon.",
+                severity=DiagnosticSeverity.Warning,
+                code="NOPTS",
+                source="mlint",
+            ),
+        ],
+    )
+
+    first = mlint_result_to_lsp_diagnostics(result)
+    second = mlint_result_to_lsp_diagnostics(result)
+
+    assert second is first
+    assert first[0].range.start.line == 0
+    assert first[0].range.start.character == 0
+
+
 def test_publish_diagnostics():
     """Test publishing diagnostics to client."""
     # Create a mock server
@@ -81,14 +105,14 @@ def test_publish_diagnostics():
             return DiagnosticResult(
                 file_uri=file_uri,
                 diagnostics=[
-                    {
-                        "line": 1,
-                        "column": 1,
-                        "message": "Test diagnostic",
-                        "severity": "error",
-                        "code": "E001",
-                        "source": "test",
-                    }
+                    AnalyzerDiagnostic(
+                        line=1,
+                        column=1,
+                        message="Test diagnostic",
+                        severity=DiagnosticSeverity.Error,
+                        code="E001",
+                        source="test",
+                    )
                 ]
             )
 
@@ -117,38 +141,38 @@ def test_severity_mapping_in_conversion():
     result = DiagnosticResult(
         file_uri="file:///test.m",
         diagnostics=[
-            {
-                "line": 1,
-                "column": 1,
-                "message": "Test",
-                "severity": "error",
-                "code": "E",
-                "source": "test",
-            },
-            {
-                "line": 2,
-                "column": 1,
-                "message": "Test",
-                "severity": "warning",
-                "code": "W",
-                "source": "test",
-            },
-            {
-                "line": 3,
-                "column": 1,
-                "message": "Test",
-                "severity": "info",
-                "code": "I",
-                "source": "test",
-            },
-            {
-                "line": 4,
-                "column": 1,
-                "message": "Test",
-                "severity": "warning",
-                "code": "",
-                "source": "test",
-            },  # Unknown code
+            AnalyzerDiagnostic(
+                line=1,
+                column=1,
+                message="Test",
+                severity=DiagnosticSeverity.Error,
+                code="E",
+                source="test",
+            ),
+            AnalyzerDiagnostic(
+                line=2,
+                column=1,
+                message="Test",
+                severity=DiagnosticSeverity.Warning,
+                code="W",
+                source="test",
+            ),
+            AnalyzerDiagnostic(
+                line=3,
+                column=1,
+                message="Test",
+                severity=DiagnosticSeverity.Information,
+                code="I",
+                source="test",
+            ),
+            AnalyzerDiagnostic(
+                line=4,
+                column=1,
+                message="Test",
+                severity=DiagnosticSeverity.Warning,
+                code="",
+                source="test",
+            ),  # Unknown code
         ]
     )
 
@@ -174,3 +198,166 @@ def test_diagnostics_handler_module_imports():
     assert publish_diagnostics is not None
     assert mlint_result_to_lsp_diagnostics is not None
     assert get_logger is not None
+
+
+async def test_diagnostics_scheduler_coalesces_changes():
+    """Test rapid requests for one URI result in a single analysis."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from src.handlers.diagnostics import DiagnosticsScheduler
+
+    server = MagicMock()
+    analyzer = MagicMock()
+    analyzer.analyze_async = AsyncMock(
+        side_effect=lambda uri, path: DiagnosticResult(
+            file_uri=uri, diagnostics=[]
+        )
+    )
+    scheduler = DiagnosticsScheduler()
+
+    for _ in range(5):
+        scheduler.schedule(server, "file:///a.m", analyzer, "/a.m", delay=0.01)
+    scheduler.schedule(server, "file:///b.m", analyzer, "/b.m", delay=0.05)
+    scheduler.schedule(server, "file:///c.m", analyzer, "/c.m", delay=0.01)
+    scheduler.cancel("file:///c.m")
+
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if server.text_document_publish_diagnostics.call_count == 2:
+            break
+
+    analyzed = sorted(
+        call.args[0] for call in analyzer.analyze_async.call_args_list
+    )
+    assert analyzed == ["file:///a.m", "file:///b.m"]
+    assert server.text_document_publish_diagnostics.call_count == 2
+
+
+async def test_diagnostics_scheduler_batches_due_files():
+    """Test files due at the same time are analyzed in one batch."""
+    import asyncio
+    from unittest.mock import MagicMock
+
+    from src.handlers.diagnostics import DiagnosticsScheduler
+
+    server = MagicMock()
+    analyzer = MagicMock()
+    analyzer.analyze_many.side_effect = lambda files: [
+        DiagnosticResult(file_uri=uri, diagnostics=[]) for uri, _ in files
+    ]
+    scheduler = DiagnosticsScheduler()
+
+    for name in ("a", "b", "c"):
+        scheduler.schedule(
+            server, f"file:///{name}.m", analyzer, f"/{name}.m", delay=0
+        )
+
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if server.text_document_publish_diagnostics.call_count == 3:
+            break
+
+    analyzer.analyze_many.assert_called_once_with(
+        [
+            ("file:///a.m", "/a.m"),
+            ("file:///b.m", "/b.m"),
+            ("file:///c.m", "/c.m"),
+        ]
+    )
+    assert server.text_document_publish_diagnostics.call_count == 3
+
+
+async def test_diagnostics_scheduler_drops_superseded_results():
+    """Test results are not published after cancel or a newer request."""
+    import asyncio
+    from unittest.mock import MagicMock
+
+    from src.handlers.diagnostics import DiagnosticsScheduler
+
+    server = MagicMock()
+    analyzer = MagicMock()
+    release = asyncio.Event()
+    started = []
+
+    async def slow_analyze(uri, path):
+        started.append(path)
+        await release.wait()
+        return DiagnosticResult(file_uri=uri, diagnostics=[])
+
+    analyzer.analyze_async = slow_analyze
+    # A second analyzer keeps the two files out of one batch
+    other_analyzer = MagicMock()
+    other_analyzer.analyze_async = slow_analyze
+    scheduler = DiagnosticsScheduler()
+
+    # Closed while running: the running analysis is cancelled
+    scheduler.schedule(server, "file:///a.m", analyzer, "/a.m", delay=0)
+    # Re-scheduled while running: only the newer analysis publishes
+    scheduler.schedule(
+        server, "file:///b.m", other_analyzer, "/b-old.m", delay=0
+    )
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if len(started) == 2:
+            break
+    scheduler.cancel("file:///a.m")
+    scheduler.schedule(
+        server, "file:///b.m", other_analyzer, "/b-new.m", delay=0
+    )
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if len(started) == 3:
+            break
+    release.set()
+    await asyncio.sleep(0.05)
+
+    published = [
+        call.args[0].uri
+        for call in server.text_document_publish_diagnostics.call_args_list
+    ]
+    assert published == ["file:///b.m"]
+    assert started == ["/a.m", "/b-old.m", "/b-new.m"]
+
+
+async def test_diagnostics_scheduler_discards_stale_batch_results():
+    """Test batch results for a closed file are not published."""
+    import asyncio
+    import threading
+    from unittest.mock import MagicMock
+
+    from src.handlers.diagnostics import DiagnosticsScheduler
+
+    server = MagicMock()
+    analyzer = MagicMock()
+    release = threading.Event()
+
+    def analyze_many(files):
+        release.wait(5)
+        return [
+            DiagnosticResult(file_uri=uri, diagnostics=[]) for uri, _ in files
+        ]
+
+    analyzer.analyze_many.side_effect = analyze_many
+    scheduler = DiagnosticsScheduler()
+
+    for name in ("a", "b"):
+        scheduler.schedule(
+            server, f"file:///{name}.m", analyzer, f"/{name}.m", delay=0
+        )
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if analyzer.analyze_many.called:
+            break
+    scheduler.cancel("file:///a.m")
+    release.set()
+    for _ in range(100):
+        await asyncio.sleep(0.01)
+        if server.text_document_publish_diagnostics.called:
+            break
+
+    published = [
+        call.args[0].uri
+        for call in server.text_document_publish_diagnostics.call_args_list
+    ]
+    assert published == ["file:///b.m"]
@@ -109,6 +109,126 @@ def test_provide_document_symbols_with_variables():
     assert len(var_symbols) >= 1
 
 
+def test_provide_document_symbols_hierarchy():
+    """Test methods and nested functions are attached to their parents."""
+    table = SymbolTable()
+    handler = DocumentSymbolHandler(symbol_table=table)
+    server = LanguageServer("test", "v0.1.0")
+    uri = "file:///test.m"
+
+    table.add_symbol(name="MyClass", kind="class", uri=uri, line=1)
+    table.add_symbol(
+        name="run", kind="method", uri=uri, line=2, scope="MyClass"
+    )
+    table.add_symbol(
+        name="main", kind="function", uri=uri, line=10, scope="global"
+    )
+    table.add_symbol(
+        name="helper", kind="function", uri=uri, line=12, scope="main"
+    )
+    table.add_symbol(
+        name="inner", kind="function", uri=uri, line=13, scope="helper"
+    )
+
+    symbols = handler.provide_document_symbols(server=server, file_uri=uri)
+
+    by_name = {s.name: s for s in symbols}
+    assert [c.name for c in by_name["MyClass"].children] == ["run"]
+    main_children = by_name["main"].children
+    assert [c.name for c in main_children] == ["helper"]
+    assert [c.name for c in main_children[0].children] == ["inner"]
+
+
+def test_nested_function_subtree_built_once():
+    """Test a nested function subtree is shared, not rebuilt."""
+    table = SymbolTable()
+    handler = DocumentSymbolHandler(symbol_table=table)
+    server = LanguageServer("test", "v0.1.0")
+    uri = "file:///test.m"
+
+    table.add_symbol(name="main", kind="function", uri=uri, line=1)
+    table.add_symbol(
+        name="helper", kind="function", uri=uri, line=2, scope="main"
+    )
+    table.add_symbol(
+        name="inner", kind="function", uri=uri, line=3, scope="helper"
+    )
+
+    symbols = handler.provide_document_symbols(server=server, file_uri=uri)
+
+    by_name = {s.name: s for s in symbols}
+    nested_helper = by_name["main"].children[0]
+    assert nested_helper.children is by_name["helper"].children
+
+
+def test_deeply_nested_functions():
+    """Test nesting deeper than the recursion limit is handled."""
+    table = SymbolTable()
+    handler = DocumentSymbolHandler(symbol_table=table)
+    server = LanguageServer("test", "v0.1.0")
+    uri = "file:///test.m"
+    depth = 2000
+
+    table.add_symbol(name="f0", kind="function", uri=uri, line=1)
+    for i in range(1, depth):
+        table.add_symbol(
+            name=f"f{i}",
+            kind="function",
+            uri=uri,
+            line=i + 1,
+            scope=f"f{i - 1}",
+        )
+
+    symbols = handler.provide_document_symbols(server=server, file_uri=uri)
+
+    node = next(s for s in symbols if s.name == "f0")
+    for i in range(1, depth):
+        assert [c.name for c in node.children] == [f"f{i}"]
+        node = node.children[0]
+    assert node.children == []
+
+
+def test_document_symbols_cached_until_file_changes():
+    """Test the outline is reused until the file's symbols change."""
+    table = SymbolTable()
+    handler = DocumentSymbolHandler(symbol_table=table)
+    server = LanguageServer("test", "v0.1.0")
+    uri = "file:///test.m"
+    table.add_symbol(name="main", kind="function", uri=uri, line=1)
+
+    first = handler.provide_document_symbols(server=server, file_uri=uri)
+    second = handler.provide_document_symbols(server=server, file_uri=uri)
+    table.add_symbol(
+        name="other", kind="function", uri="file:///other.m", line=1
+    )
+    third = handler.provide_document_symbols(server=server, file_uri=uri)
+    table.add_symbol(name="helper", kind="function", uri=uri, line=5)
+    fourth = handler.provide_document_symbols(server=server, file_uri=uri)
+
+    assert second is first
+    assert third is first
+    assert [s.name for s in fourth] == ["main", "helper"]
+
+
+def test_document_symbol_cache_is_bounded():
+    """Test outlines are evicted least recently used and on invalidate."""
+    table = SymbolTable()
+    handler = DocumentSymbolHandler(symbol_table=table)
+    handler.RESULT_CACHE_SIZE = 2
+    server = LanguageServer("test", "v0.1.0")
+    uris = [f"file:///{name}.m" for name in ("a", "b", "c")]
+    for uri in uris:
+        table.add_symbol(name="main", kind="function", uri=uri, line=1)
+
+    for uri in uris:
+        handler.provide_document_symbols(server=server, file_uri=uri)
+
+    assert list(handler._cache) == uris[1:]
+
+    handler.invalidate(uris[2])
+    assert list(handler._cache) == [uris[1]]
+
+
 def test_map_symbol_kind():
     """Test mapping symbol kinds."""
     table = SymbolTable()
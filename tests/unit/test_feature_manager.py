@@ -145,6 +145,13 @@ def test_get_capabilities_returns_server_capabilities():
     assert isinstance(capabilities, ServerCapabilities)
 
 
+def test_get_capabilities_reuses_instance():
+    """Test capabilities are built once and returned on every call."""
+    manager = FeatureManager()
+
+    assert manager.get_capabilities() is manager.get_capabilities()
+
+
 def test_feature_manager_module_imports():
     """Test that FeatureManager module can be imported."""
     from src.features.feature_manager import FeatureManager, get_logger
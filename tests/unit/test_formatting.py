@@ -40,6 +40,20 @@ end
     assert lines[4] == "    end"
 
 
+def test_format_matlab_code_matches_whole_keywords():
+    """Test identifiers that start with a keyword don't change indent."""
+    handler = FormattingHandler()
+
+    code = "function test()\nformat long\nendpoint = 1;\nx = 2;\nend\n"
+
+    lines = handler._format_matlab_code(code).split("\n")
+
+    assert lines[1] == "    format long"
+    assert lines[2] == "    endpoint = 1;"
+    assert lines[3] == "    x = 2;"
+    assert lines[4] == "end"
+
+
 def test_format_matlab_code_with_tabs():
     """Test formatting MATLAB code with tabs."""
     handler = FormattingHandler()
@@ -77,6 +91,49 @@ end
     assert len(edits) >= 1
 
 
+def test_provide_formatting_edit_covers_document():
+    """Test the formatting edit replaces the whole document."""
+    handler = FormattingHandler()
+    server = LanguageServer("test", "v0.1.0")
+
+    for content, end in (
+        ("function test()\nx = 1;\nend", (2, 3)),
+        ("function test()\nx = 1;\nend\n", (3, 0)),
+        ("  x = 1;", (0, 8)),
+    ):
+        edits = handler.provide_formatting(
+            server=server,
+            file_uri="file:///test.m",
+            content=content,
+        )
+
+        assert len(edits) == 1
+        edit_end = edits[0].range.end
+        assert (edit_end.line, edit_end.character) == end
+
+
+def test_provide_formatting_reuses_result(monkeypatch):
+    """Test identical requests skip reformatting."""
+    handler = FormattingHandler()
+    server = LanguageServer("test", "v0.1.0")
+    calls = []
+    format_code = handler._format_matlab_code
+
+    def counting_format(content, **kwargs):
+        calls.append(content)
+        return format_code(content, **kwargs)
+
+    monkeypatch.setattr(handler, "_format_matlab_code", counting_format)
+    content = "function test()\nx = 1;\nend\n"
+
+    first = handler.provide_formatting(server, "file:///test.m", content)
+    second = handler.provide_formatting(server, "file:///test.m", content)
+    handler.provide_formatting(server, "file:///test.m", content + "y = 2;\n")
+
+    assert second == first
+    assert len(calls) == 2
+
+
 def test_provide_formatting_no_changes():
     """Test providing formatting without changes."""
     handler = FormattingHandler()
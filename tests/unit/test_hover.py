@@ -83,6 +83,36 @@ def test_provide_hover_empty_word():
     assert result is None
 
 
+def test_provide_hover_skips_keywords_and_literals():
+    """Test keywords, numbers and operators skip the symbol lookup."""
+    table = SymbolTable()
+    handler = HoverHandler(symbol_table=table)
+    server = LanguageServer("test", "v0.1.0")
+    table.add_symbol(
+        name="methods",
+        kind="function",
+        uri="file:///test.m",
+        line=1,
+    )
+
+    for word in ("end", "for", "1", "="):
+        result = handler.provide_hover(
+            server=server,
+            file_uri="file:///test.m",
+            position=Position(line=0, character=0),
+            word=word,
+        )
+        assert result is None
+
+    result = handler.provide_hover(
+        server=server,
+        file_uri="file:///test.m",
+        position=Position(line=0, character=0),
+        word="methods",
+    )
+    assert result is not None
+
+
 def test_create_hover_content():
     """Test creating hover content from symbol."""
     table = SymbolTable()
@@ -109,6 +139,26 @@ def test_create_hover_content():
     assert "Calculate sum of x and y" in content
 
 
+def test_create_hover_content_layout():
+    """Test hover markdown separates heading, detail and documentation."""
+    handler = HoverHandler(symbol_table=SymbolTable())
+
+    from src.utils.symbol_table import Symbol
+    full = Symbol(
+        name="f",
+        kind="function",
+        uri="file:///test.m",
+        detail="function f(x)",
+        documentation="Doc.",
+    )
+    bare = Symbol(name="v", kind="variable", uri="file:///test.m")
+
+    assert handler._create_hover_content(full) == (
+        "**🔹 function: f**\n\nfunction f(x)\n\n---\n\nDoc."
+    )
+    assert handler._create_hover_content(bare) == "**📝 variable: v**"
+
+
 def test_find_symbol_at_position():
     """Test finding symbol at position."""
     table = SymbolTable()
@@ -0,0 +1,388 @@
+"""
+Unit tests for Mlint Analyzer.
+"""
+
+import os
+
+import pytest
+from lsprotocol.types import DiagnosticSeverity
+
+from src.analyzer import mlint_analyzer
+from src.analyzer.mlint_analyzer import MlintAnalyzer
+
+
+def _make_analyzer(monkeypatch, mlint_path):
+    """Create MlintAnalyzer using the given mlint path."""
+    monkeypatch.setattr(
+        mlint_analyzer,
+        "_resolve_mlint_path",
+        lambda *args: str(mlint_path) if mlint_path else None,
+    )
+    return MlintAnalyzer()
+
+
+@pytest.fixture
+def mlint_cache(tmp_path, monkeypatch):
+    """
+    Redirect the persisted mlint path cache to a temporary file.
+
+    Returns:
+        Path: Path to temporary cache file
+    """
+    cache_file = tmp_path / "cache" / "mlint_path"
+    monkeypatch.setattr(mlint_analyzer, "MLINT_CACHE_FILE", cache_file)
+    mlint_analyzer._MLINT_PATH_CACHE.clear()
+    yield cache_file
+    mlint_analyzer._MLINT_PATH_CACHE.clear()
+
+
+@pytest.fixture
+def fake_mlint(tmp_path):
+    """
+    Create a fake mlint executable.
+
+    Returns:
+        Path: Path to fake mlint executable
+    """
+    path = tmp_path / "mlint"
+    path.write_text("")
+    return path
+
+
+def test_mlint_path_cached_across_instances(
+    mlint_cache, fake_mlint, monkeypatch
+):
+    """Test discovery runs once for several analyzer instances."""
+    calls = []
+
+    def discover(matlab_path):
+        calls.append(matlab_path)
+        return str(fake_mlint)
+
+    monkeypatch.setattr(mlint_analyzer, "_discover_mlint_path", discover)
+
+    first = MlintAnalyzer()
+    second = MlintAnalyzer()
+
+    assert first.mlint_path == str(fake_mlint)
+    assert second.mlint_path == str(fake_mlint)
+    assert len(calls) == 1
+    assert mlint_cache.exists()
+
+
+def test_mlint_path_loaded_from_disk(mlint_cache, fake_mlint, monkeypatch):
+    """Test persisted mlint path is reused by a new process."""
+    monkeypatch.setattr(
+        mlint_analyzer, "_discover_mlint_path", lambda _: str(fake_mlint)
+    )
+    MlintAnalyzer()
+
+    # Simulate a new process: empty in-memory cache, no discovery
+    mlint_analyzer._MLINT_PATH_CACHE.clear()
+    monkeypatch.setattr(mlint_analyzer, "_discover_mlint_path", lambda _: None)
+
+    assert MlintAnalyzer().mlint_path == str(fake_mlint)
+
+
+def test_mlint_path_cache_invalidated(mlint_cache, fake_mlint, monkeypatch):
+    """Test persisted path is ignored for another MATLAB path or mtime."""
+    monkeypatch.setattr(
+        mlint_analyzer, "_discover_mlint_path", lambda _: str(fake_mlint)
+    )
+    MlintAnalyzer()
+    mlint_analyzer._MLINT_PATH_CACHE.clear()
+    monkeypatch.setattr(mlint_analyzer, "_discover_mlint_path", lambda _: None)
+
+    assert MlintAnalyzer(matlab_path="/other/MATLAB").mlint_path is None
+
+    fake_mlint.write_text("changed")
+    mtime = fake_mlint.stat().st_mtime + 10
+    os.utime(fake_mlint, (mtime, mtime))
+    mlint_analyzer._MLINT_PATH_CACHE.clear()
+
+    assert MlintAnalyzer().mlint_path is None
+
+
+def test_failed_mlint_lookup_not_cached(mlint_cache, fake_mlint, monkeypatch):
+    """Test mlint installed after a failed lookup is found later."""
+    monkeypatch.setattr(mlint_analyzer, "_discover_mlint_path", lambda _: None)
+    analyzer = MlintAnalyzer()
+    assert analyzer.mlint_path is None
+    assert not analyzer.is_available()
+
+    monkeypatch.setattr(
+        mlint_analyzer, "_discover_mlint_path", lambda _: str(fake_mlint)
+    )
+
+    assert MlintAnalyzer().mlint_path == str(fake_mlint)
+    assert analyzer.refresh_availability() is True
+    assert analyzer.mlint_path == str(fake_mlint)
+
+
+def test_find_mlint_in_dir_prefers_newest_version(tmp_path, monkeypatch):
+    """Test mlint is found under <version>/bin/<arch>, newest first."""
+    monkeypatch.setattr(mlint_analyzer.platform, "system", lambda: "Linux")
+    for version in ("R2022a", "R2023b"):
+        arch_dir = tmp_path / version / "bin" / "glnxa64"
+        arch_dir.mkdir(parents=True)
+        (arch_dir / "mlint").write_text("")
+    (tmp_path / "R2023b" / "toolbox" / "bin").mkdir(parents=True)
+
+    found = mlint_analyzer._find_mlint_in_dir(tmp_path)
+
+    assert found == str(tmp_path / "R2023b" / "bin" / "glnxa64" / "mlint")
+
+
+def test_find_mlint_in_dir_not_found(tmp_path):
+    """Test None is returned when no mlint exists."""
+    assert mlint_analyzer._find_mlint_in_dir(tmp_path) is None
+
+
+def test_common_matlab_dirs_skips_missing(tmp_path, monkeypatch):
+    """Test only existing install directories are yielded, in order."""
+    existing = tmp_path / "opt" / "MATLAB"
+    existing.mkdir(parents=True)
+    monkeypatch.setitem(
+        mlint_analyzer.MLINT_COMMON_DIRS,
+        "Linux",
+        (tmp_path / "missing", existing, tmp_path),
+    )
+
+    dirs = list(mlint_analyzer._common_matlab_dirs("Linux"))
+
+    assert dirs == [existing, tmp_path]
+
+
+def test_parse_line(monkeypatch):
+    """Test mlint output lines are parsed into diagnostics."""
+    analyzer = _make_analyzer(monkeypatch, None)
+    output = (
+        b"========== /tmp/test.m ==========\n"
+        b"L 3 (C 5-10): Variable 'x' might be unused.\r\n"
+        b"L 7: Missing semicolon.\n"
+        b"\n"
+        b"not a diagnostic\n"
+    )
+
+    parsed = map(analyzer._parse_line, output.splitlines(keepends=True))
+    diagnostics = [d for d in parsed if d is not None]
+
+    assert len(diagnostics) == 2
+    assert diagnostics[0].line == 3
+    assert diagnostics[0].code == "C 5-10"
+    assert diagnostics[0].message == "Variable 'x' might be unused."
+    assert diagnostics[0].severity == DiagnosticSeverity.Warning
+    assert diagnostics[1].line == 7
+    assert diagnostics[1].code == ""
+    assert diagnostics[1].message == "Missing semicolon."
+
+
+def test_analyze_streams_mlint_output(tmp_path, monkeypatch):
+    """Test analyze parses diagnostics written by mlint to stderr."""
+    fake = tmp_path / "mlint"
+    fake.write_text(
+        "#!/bin/sh\n"
+        "echo '========== '$1' ==========' >&2\n"
+        "echo 'L 1 (E): Parse error.' >&2\n"
+        "echo 'L 2 (W 1-3): Unused variable.' >&2\n"
+        "exit 1\n"
+    )
+    fake.chmod(0o755)
+    m_file = tmp_path / "test.m"
+    m_file.write_text("x = 1\n")
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    result = analyzer.analyze("file:///test.m", str(m_file))
+
+    assert [d.line for d in result.diagnostics] == [1, 2]
+    assert result.diagnostics[0].severity == DiagnosticSeverity.Error
+    assert result.diagnostics[1].severity == DiagnosticSeverity.Warning
+
+
+@pytest.mark.parametrize(
+    "msg_id, severity",
+    [
+        ("E", DiagnosticSeverity.Error),
+        ("F 2", DiagnosticSeverity.Error),
+        ("c 5-10", DiagnosticSeverity.Warning),
+        ("W", DiagnosticSeverity.Warning),
+        ("I", DiagnosticSeverity.Information),
+        ("NOPTS", DiagnosticSeverity.Warning),
+        ("", DiagnosticSeverity.Warning),
+    ],
+)
+def test_severity_from_message_id(msg_id, severity, monkeypatch):
+    """Test mlint message IDs map to LSP severity levels."""
+    analyzer = _make_analyzer(monkeypatch, None)
+    line = f"L 1 ({msg_id}): Message." if msg_id else "L 1: Message."
+
+    diagnostic = analyzer._parse_line(line.encode())
+
+    assert diagnostic is not None
+    assert diagnostic.severity == severity
+
+
+def test_analyze_many_splits_output_by_file(tmp_path, monkeypatch):
+    """Test one mlint run is split into per-file results."""
+    fake = tmp_path / "mlint"
+    fake.write_text(
+        "#!/bin/sh\n"
+        'for f in "$@"; do\n'
+        '  [ "$f" = -id ] && continue\n'
+        '  echo "========== $f ==========" >&2\n'
+        '  echo "L 1 (W): Warning in $(basename $f)." >&2\n'
+        "done\n"
+        "echo run >> " + str(tmp_path / "runs") + "\n"
+    )
+    fake.chmod(0o755)
+    files = []
+    for name in ("a.m", "b.m"):
+        m_file = tmp_path / name
+        m_file.write_text("x = 1\n")
+        files.append(("file:///" + name, str(m_file)))
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    results = analyzer.analyze_many(files)
+
+    assert [r.file_uri for r in results] == ["file:///a.m", "file:///b.m"]
+    assert results[0].diagnostics[0].message == "Warning in a.m."
+    assert results[1].diagnostics[0].message == "Warning in b.m."
+    assert (tmp_path / "runs").read_text() == "run\n"
+
+
+def test_analyze_many_reanalyzes_files_without_header(tmp_path, monkeypatch):
+    """Test a file whose header path doesn't match is analyzed alone."""
+    fake = tmp_path / "mlint"
+    fake.write_text(
+        "#!/bin/sh\n"
+        'for f in "$@"; do\n'
+        '  [ "$f" = -id ] && continue\n'
+        '  case "$f" in\n'
+        '    *b.m) echo "========== B~1.M ==========" >&2 ;;\n'
+        '    *) echo "========== $f ==========" >&2 ;;\n'
+        "  esac\n"
+        '  echo "L 1 (W): Warning in $(basename $f)." >&2\n'
+        "done\n"
+    )
+    fake.chmod(0o755)
+    files = []
+    for name in ("a.m", "b.m", "c.m"):
+        m_file = tmp_path / name
+        m_file.write_text("x = 1\n")
+        files.append(("file:///" + name, str(m_file)))
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    results = analyzer.analyze_many(files)
+
+    assert [r.file_uri for r in results] == [uri for uri, _ in files]
+    assert [r.diagnostics[0].message for r in results] == [
+        "Warning in a.m.",
+        "Warning in b.m.",
+        "Warning in c.m.",
+    ]
+
+
+async def test_analyze_async(tmp_path, monkeypatch):
+    """Test analyze_async parses mlint output from a subprocess."""
+    fake = tmp_path / "mlint"
+    fake.write_text("#!/bin/sh\necho 'L 4 (I): Info message.' >&2\n")
+    fake.chmod(0o755)
+    m_file = tmp_path / "test.m"
+    m_file.write_text("x = 1\n")
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    result = await analyzer.analyze_async("file:///test.m", str(m_file))
+
+    assert len(result.diagnostics) == 1
+    assert result.diagnostics[0].line == 4
+    assert result.diagnostics[0].severity == DiagnosticSeverity.Information
+
+
+async def test_analyze_async_reuses_result(tmp_path, monkeypatch):
+    """Test analyze_async reuses the result for unchanged content."""
+    fake = tmp_path / "mlint"
+    fake.write_text("#!/bin/sh\necho 'L 1 (W): Warning.' >&2\n")
+    fake.chmod(0o755)
+    m_file = tmp_path / "test.m"
+    m_file.write_text("x = 1\n")
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    first = await analyzer.analyze_async("file:///test.m", str(m_file))
+    second = await analyzer.analyze_async("file:///test.m", str(m_file))
+
+    assert second is first
+
+
+def test_analyze_reuses_result_for_unchanged_content(tmp_path, monkeypatch):
+    """Test mlint is only re-run when file content changes."""
+    runs = tmp_path / "runs"
+    fake = tmp_path / "mlint"
+    fake.write_text(
+        "#!/bin/sh\n" f"echo run >> {runs}\n" "echo 'L 1 (W): Warning.' >&2\n"
+    )
+    fake.chmod(0o755)
+    m_file = tmp_path / "test.m"
+    m_file.write_text("x = 1\n")
+    analyzer = _make_analyzer(monkeypatch, fake)
+
+    first = analyzer.analyze("file:///test.m", str(m_file))
+    second = analyzer.analyze("file:///test.m", str(m_file))
+    m_file.write_text("x = 2\n")
+    analyzer.analyze("file:///test.m", str(m_file))
+
+    assert second is first
+    assert runs.read_text() == "run\nrun\n"
+
+
+def test_find_mlint_in_path_checks_one_level(tmp_path, monkeypatch):
+    """Test PATH entries are searched one level deep, not recursively."""
+    arch_dir = tmp_path / "MATLAB" / "bin" / "glnxa64"
+    arch_dir.mkdir(parents=True)
+    (arch_dir / "mlint").write_text("")
+    deep_dir = tmp_path / "other" / "a" / "b"
+    deep_dir.mkdir(parents=True)
+    (deep_dir / "mlint").write_text("")
+    monkeypatch.setattr(mlint_analyzer.shutil, "which", lambda name: None)
+
+    monkeypatch.setenv("PATH", str(tmp_path / "other"))
+    assert mlint_analyzer._find_mlint_in_path() is None
+
+    monkeypatch.setenv(
+        "PATH", os.pathsep.join(["", str(tmp_path / "MATLAB" / "bin")])
+    )
+    assert mlint_analyzer._find_mlint_in_path() == str(arch_dir / "mlint")
+
+
+def test_refresh_availability(fake_mlint, monkeypatch):
+    """Test availability is cached until explicitly refreshed."""
+    analyzer = _make_analyzer(monkeypatch, fake_mlint)
+    assert analyzer.is_available()
+
+    fake_mlint.unlink()
+    assert analyzer.is_available()
+    assert analyzer.refresh_availability() is False
+    assert not analyzer.is_available()
+
+
+def test_cache_key_skips_hashing_unchanged_file(tmp_path, monkeypatch):
+    """Test content is only re-hashed when mtime or size changes."""
+    m_file = tmp_path / "test.m"
+    m_file.write_text("x = 1\n")
+    analyzer = _make_analyzer(monkeypatch, None)
+    hashed = []
+    blake2b = mlint_analyzer.hashlib.blake2b
+
+    def counting_blake2b(data, **kwargs):
+        hashed.append(data)
+        return blake2b(data, **kwargs)
+
+    monkeypatch.setattr(mlint_analyzer.hashlib, "blake2b", counting_blake2b)
+
+    first = analyzer._cache_key("file:///test.m", str(m_file))
+    second = analyzer._cache_key("file:///test.m", str(m_file))
+    m_file.write_text("x = 10\n")
+    third = analyzer._cache_key("file:///test.m", str(m_file))
+
+    assert first == second
+    assert third != first
+    assert len(hashed) == 2
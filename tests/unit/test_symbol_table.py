@@ -89,6 +89,95 @@ def test_remove_symbols_by_uri():
     assert len(table.get_symbols_by_uri("file:///test.m")) == 0
 
 
+def test_symbol_name_lower():
+    """Test lowercased name is precomputed on construction."""
+    symbol = Symbol(name="MyFunc", kind="function", uri="file:///a.m")
+
+    assert symbol.name_lower == "myfunc"
+    assert "name_lower" not in repr(symbol)
+
+
+def test_get_symbols_by_lower_name():
+    """Test case-insensitive name index follows adds and removals."""
+    table = SymbolTable()
+    table.add_symbol(
+        name="MyFunc",
+        kind="function",
+        uri="file:///a.m",
+        line=1,
+    )
+    table.add_symbol(
+        name="myfunc",
+        kind="function",
+        uri="file:///b.m",
+        line=3,
+    )
+
+    results = table.get_symbols_by_lower_name("myfunc")
+    assert [s.uri for s in results] == ["file:///a.m", "file:///b.m"]
+
+    table.remove_symbols_by_uri("file:///a.m")
+    results = table.get_symbols_by_lower_name("myfunc")
+    assert [s.uri for s in results] == ["file:///b.m"]
+
+    table.clear()
+    assert table.get_symbols_by_lower_name("myfunc") == []
+
+
+def test_get_symbols_in_line_range():
+    """Test per-file line index returns symbols sorted by line."""
+    table = SymbolTable()
+    for name, line in (("c", 30), ("a", 2), ("b", 12), ("d", 8)):
+        table.add_symbol(
+            name=name,
+            kind="function",
+            uri="file:///test.m",
+            line=line,
+        )
+
+    results = table.get_symbols_in_line_range("file:///test.m", 2, 12)
+    assert [s.name for s in results] == ["a", "d", "b"]
+    assert table.get_symbols_in_line_range("file:///test.m", 13, 29) == []
+    assert table.get_symbols_in_line_range("file:///other.m", 1, 99) == []
+
+    table.remove_symbols_by_uri("file:///test.m")
+    assert table.get_symbols_in_line_range("file:///test.m", 1, 99) == []
+
+
+def test_get_all_symbols_tracks_changes():
+    """Test cached flat symbol list is refreshed after changes."""
+    table = SymbolTable()
+    table.add_symbol(name="a", kind="function", uri="file:///a.m", line=1)
+
+    first = table.get_all_symbols()
+    first.clear()
+    assert [s.name for s in table.get_all_symbols()] == ["a"]
+
+    table.add_symbol(name="b", kind="function", uri="file:///b.m", line=1)
+    assert [s.name for s in table.get_all_symbols()] == ["a", "b"]
+
+    table.remove_symbols_by_uri("file:///a.m")
+    assert [s.name for s in table.get_all_symbols()] == ["b"]
+
+
+def test_uri_version_dropped_with_symbols():
+    """Test per-file versions are dropped on removal and clear."""
+    table = SymbolTable()
+    table.add_symbol(name="a", kind="function", uri="file:///a.m", line=1)
+    table.add_symbol(name="b", kind="function", uri="file:///b.m", line=1)
+    version = table.get_uri_version("file:///a.m")
+
+    table.remove_symbols_by_uri("file:///a.m")
+    assert "file:///a.m" not in table._uri_versions
+    assert table.get_uri_version("file:///a.m") == 0
+
+    table.add_symbol(name="a", kind="function", uri="file:///a.m", line=1)
+    assert table.get_uri_version("file:///a.m") > version
+
+    table.clear()
+    assert table._uri_versions == {}
+
+
 def test_clear_symbol_table():
     """Test clearing symbol table."""
     table = SymbolTable()